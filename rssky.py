@@ -11,29 +11,41 @@ This is the main application file that orchestrates the entire process:
 6. Generate HTML reports
 """
 
+import atexit
 import os
 import sys
 import argparse
 import datetime
 import logging
+import logging.handlers
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-from rssky.core.config import Config
-from rssky.core.feed_manager import FeedManager
-from rssky.core.content_processor import ContentProcessor
-from rssky.core.ai_processor import AIProcessor
-from rssky.core.cache_manager import CacheManager
-from rssky.core.report_generator import ReportGenerator
 
-
-def setup_logging():
+def setup_logging(verbose=False):
     """Configure logging for the application"""
+    # Buffer file writes in memory so the hot loops don't pay one small
+    # write per log record; the buffer flushes on WARNING and above, when
+    # full, and at interpreter exit
+    file_handler = logging.FileHandler("rssky.log")
+    # MemoryHandler delegates formatting to its target at flush time, so
+    # the formatter basicConfig attaches to the wrapper never reaches the
+    # file; set it on the FileHandler itself
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+    )
+    atexit.register(memory_handler.flush)
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=logging.DEBUG if verbose else logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler("rssky.log"),
+            memory_handler,
         ],
     )
     return logging.getLogger("rssky")
@@ -47,6 +59,10 @@ def parse_arguments():
     parser.add_argument("--config", default="config.ini", help="Path to configuration file (default: config.ini)")
     parser.add_argument("--opml", help="Path to OPML file (default: any .opml file in current directory)")
     parser.add_argument("--skip-prefetch", action="store_true", help="Skip prefetching of all feeds from the last 7 days")
+    parser.add_argument("--run-tests", action="store_true", help="Run the test suite before processing (default: off)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging (default: info)")
+    parser.add_argument("--debug", action="store_true", help="Empty the debug/ directory before running")
+    parser.add_argument("--no-prompt-cache", action="store_true", help="Bypass the prompt-level AI response cache")
     return parser.parse_args()
 
 
@@ -54,34 +70,64 @@ def find_opml_file(specified_file=None):
     """Find OPML file in the current directory or use the specified one"""
     if specified_file and os.path.exists(specified_file):
         return specified_file
-    
-    # Look for any .opml file in the current directory
-    opml_files = list(Path(".").glob("*.opml"))
-    if opml_files:
-        return str(opml_files[0])
-    
+
+    # Look for any .opml file in the current directory, stopping at the
+    # first hit instead of materializing every match
+    with os.scandir(".") as it:
+        for dir_entry in it:
+            if dir_entry.name.endswith(".opml") and dir_entry.is_file():
+                return dir_entry.name
+
     logging.error("No OPML file found")
     sys.exit(1)
 
 
+def _render_reports(digest, report_date, output_dir="output"):
+    """Render the daily report and refresh the index.
+
+    Runs in-process: rendering is the program's final step, so there is
+    nothing left to overlap it with, and a worker process would only add
+    spawn and pickling overhead.
+    """
+    from rssky.core.report_generator import ReportGenerator
+
+    report_generator = ReportGenerator(output_dir=output_dir)
+    report_generator.create_daily_report(digest, report_date)
+    report_generator.update_index()
+
+
 def main():
     """Main application entry point"""
-    # Empty debug directory at the start of every run
-    debug_dir = Path("debug")
-    if debug_dir.exists() and debug_dir.is_dir():
-        for item in debug_dir.iterdir():
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir():
-                import shutil
-                shutil.rmtree(item)
-    logger = setup_logging()
-    logger.info("Emptied debug directory.")
+    # Parse command line arguments first so the logging level is known
+    args = parse_arguments()
+
+    # Empty the debug directory only when explicitly requested; the
+    # recursive remove is wasted syscalls on routine runs
+    if args.debug:
+        shutil.rmtree("debug", ignore_errors=True)
+        os.makedirs("debug", exist_ok=True)
+    logger = setup_logging(verbose=args.verbose)
+    if args.debug:
+        logger.info("Emptied debug directory.")
     logger.info("Starting RSSky")
 
-    # Parse command line arguments
-    args = parse_arguments()
-    
+    # Import the core modules only after argument parsing so that e.g.
+    # --help doesn't pay for feedparser, bs4 and friends
+    from rssky.core.config import Config
+    from rssky.core.feed_manager import FeedManager
+    from rssky.core.content_processor import ContentProcessor
+    from rssky.core.ai_processor import AIProcessor
+    from rssky.core.cache_manager import CacheManager
+
+    # Optionally run the test suite first; imported lazily so normal runs
+    # never pay for the test machinery
+    if args.run_tests:
+        from tests.run_tests import run_tests
+        test_result = run_tests()
+        if test_result != 0:
+            logger.error("Test suite failed, aborting")
+            sys.exit(test_result)
+
     # Find OPML file
     opml_file = find_opml_file(args.opml)
     logger.info(f"Using OPML file: {opml_file}")
@@ -102,9 +148,15 @@ def main():
             clear_cache=args.clear_cache
         )
         
+        # One shared HTTP session for all feed fetches so keep-alive
+        # connections are reused across feeds on the same host
+        import requests
+        session = requests.Session()
+
         feed_manager = FeedManager(
             opml_file=opml_file,
-            cache_manager=cache_manager
+            cache_manager=cache_manager,
+            session=session
         )
         
         content_processor = ContentProcessor(
@@ -113,94 +165,131 @@ def main():
         
         ai_processor = AIProcessor(
             config=config,
-            cache_manager=cache_manager
-        )
-        
-        report_generator = ReportGenerator(
-            output_dir="output"
+            cache_manager=cache_manager,
+            use_prompt_cache=not args.no_prompt_cache
         )
-        
+
         # Load all feeds
         feeds = feed_manager.load_feeds()
         logger.info(f"Loaded {len(feeds)} feeds from OPML")
-        
+
+        # Compute the date range once; both the prefetch and digest phases
+        # use the same window
+        today = datetime.date.today()
+        start_date = today - datetime.timedelta(days=args.days)
+
         # Prefetch all feeds from the specified date range
         if not args.skip_prefetch:
             logger.info(f"Prefetching feeds from the last {args.days} days")
-            prefetch_date = datetime.datetime.now().date() - datetime.timedelta(days=args.days)
-            
+            prefetch_date = start_date
+
             # Initialize a counter for prefetched entries
             prefetched_entries = 0
-            
-            # Prefetch and cache all feeds
-            for feed in feeds:
+
+            def _prefetch_one(feed):
+                """Fetch one feed and cache content for its entries.
+
+                Returns (feed, entries, error) so per-feed failures don't
+                abort the other workers.
+                """
                 try:
                     feed_entries = feed_manager.get_feed_entries(feed, since_date=prefetch_date)
-                    logger.info(f"Prefetched {len(feed_entries)} entries from '{feed['title']}'")
-                    prefetched_entries += len(feed_entries)
-                    
-                    # Process and cache the content for each entry
+
+                    # Process and cache the content for each entry;
+                    # get_feed_entries has already applied the date filter
                     for entry in feed_entries:
                         # Add feed URL to entry for cache operations
                         entry['feed_url'] = feed['url']
                         entry['feed_title'] = feed['title']
-                        
-                        # Only process entries that fall within the date range
-                        entry_date = entry.get('parsed_date')
-                        if entry_date and entry_date.date() >= prefetch_date:
-                            # Extract and cache full content
-                            content_processor.process_entry(entry)
-                        else:
-                            logger.debug(f"Skipping entry outside date range: {entry.get('title', 'Unknown')}")
+
+                        # Extract and cache full content
+                        content_processor.process_entry(entry)
+                    return feed, feed_entries, None
                 except Exception as e:
-                    logger.error(f"Error prefetching feed '{feed['title']}': {e}")
-            
+                    return feed, [], e
+
+            # Prefetch and cache all feeds concurrently; this is network-bound
+            # work, so threads overlap the HTTP round trips
+            with ThreadPoolExecutor(max_workers=min(16, max(1, len(feeds)))) as executor:
+                futures = [executor.submit(_prefetch_one, feed) for feed in feeds]
+                for future in as_completed(futures):
+                    feed, feed_entries, error = future.result()
+                    if error:
+                        logger.error(f"Error prefetching feed '{feed['title']}': {error}")
+                    else:
+                        logger.info(f"Prefetched {len(feed_entries)} entries from '{feed['title']}'")
+                        prefetched_entries += len(feed_entries)
+
             logger.info(f"Completed prefetching {prefetched_entries} entries from all feeds")
         
         # Process date range for the digest
-        today = datetime.datetime.now().date()
-        start_date = today - datetime.timedelta(days=args.days)
         logger.info(f"Processing entries from {start_date} to {today}")
         
-        # Process each feed and its entries for the specified date range
-        all_processed_entries = []
-        for feed in feeds:
-            feed_entries = feed_manager.get_feed_entries(feed, since_date=start_date)
+        # Fetch entries for all feeds concurrently (usually cache hits after
+        # the prefetch phase, but cold feeds still benefit from the overlap)
+        feed_entry_lists = feed_manager.fetch_many(feeds, since_date=start_date)
+
+        # Process each feed and its entries for the specified date range,
+        # collecting entries that still need an AI summary. Articles
+        # syndicated by several feeds are summarized only once.
+        from rssky.utils.helpers import canonical_url
+        pending_summaries = []
+        seen_entries = set()
+        for feed, feed_entries in feed_entry_lists:
             logger.info(f"Processing {len(feed_entries)} entries from '{feed['title']}'")
-            
+
+            # These depend only on the feed, so compute them once per feed
+            # rather than once per entry
+            feed_url = feed['url']
+            feed_title = feed['title']
+            feed_id = cache_manager.generate_feed_id(feed_url, feed_title)
+
+            # get_feed_entries has already applied the date filter
             for entry in feed_entries:
                 # Add feed URL to entry for cache operations
-                entry['feed_url'] = feed['url']
-                entry['feed_title'] = feed['title']
-                
-                # Ensure the entry is within the date range
-                entry_date = entry.get('parsed_date')
-                if entry_date and entry_date.date() >= start_date:
-                    # Extract full content (should already be cached from prefetch)
-                    entry_content = content_processor.process_entry(entry)
-                    
-                    # Generate cache keys for summary check
-                    feed_id = cache_manager.generate_feed_id(feed['url'], feed['title'])
-                    entry_id = CacheManager.create_entry_cache_key(entry)
-                    # Generate AI summary if needed
-                    if not cache_manager.has_entry_summary(feed_id, entry_id):
-                        logger.info(f"No cached summary found, generating for: {entry.get('title', 'Unknown')}")
-                        ai_processor.summarize_entry(entry, feed_id, feed['title'])
-                    else:
-                        logger.info(f"Using cached summary for: {entry.get('title', 'Unknown')}")
-                    
-                    # Add to processed entries list
-                    all_processed_entries.append(entry)
+                entry['feed_url'] = feed_url
+                entry['feed_title'] = feed_title
+
+                # Skip articles already seen via another feed; each duplicate
+                # would otherwise cost its own LLM call
+                dedup_key = canonical_url(entry.get('link', '')) or entry.get('id') or entry.get('title', '')
+                if dedup_key in seen_entries:
+                    logger.info(f"Skipping duplicate entry: {entry.get('title', 'Unknown')}")
+                    entry['is_duplicate'] = True
+                    continue
+                seen_entries.add(dedup_key)
+
+                # Extract full content (should already be cached from prefetch)
+                entry_content = content_processor.process_entry(entry)
+
+                # Generate cache key for summary check
+                entry_id = CacheManager.get_entry_cache_key(entry)
+                # Queue entries that need an AI summary
+                if not cache_manager.has_entry_summary(feed_id, entry_id):
+                    logger.info(f"No cached summary found, queueing for: {entry.get('title', 'Unknown')}")
+                    pending_summaries.append((entry, feed_id, feed_title))
                 else:
-                    logger.debug(f"Skipping entry outside date range: {entry.get('title', 'Unknown')}")
+                    logger.info(f"Using cached summary for: {entry.get('title', 'Unknown')}")
+
+        # Generate the missing summaries; AIProcessor batches them into
+        # multi-entry API calls and runs the batches concurrently
+        ai_processor.summarize_entries(pending_summaries)
         
-        # Generate daily digest
+        # Generate daily digest, streaming the processed entries rather than
+        # materializing another list alongside the fetched ones
         report_date = today.strftime("%Y%m%d")
         logger.info(f"Generating digest for {report_date}")
-        
-        digest = ai_processor.generate_digest(report_date, all_processed_entries)
-        report_generator.create_daily_report(digest, report_date)
-        report_generator.update_index()
+
+        processed_entries = (
+            entry
+            for feed, feed_entries in feed_entry_lists
+            for entry in feed_entries
+            if not entry.get('is_duplicate')
+        )
+        digest = ai_processor.generate_digest(report_date, processed_entries)
+
+        # Render the HTML report and index
+        _render_reports(digest, report_date)
         
         logger.info("RSSky processing completed successfully")
         return 0
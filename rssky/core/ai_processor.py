@@ -5,31 +5,245 @@ This module handles the AI processing of article content, generating summaries
 and importance ratings for individual articles, and creating the daily digest.
 """
 
-import json
+import hashlib
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import datetime
+import email.utils
 from datetime import datetime
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import os
+import random
+import threading
+import time
 from dateutil import parser
-import re
 import demjson3
+import orjson
 
 from rssky.utils.helpers import format_date
 from rssky.core.cache_manager import CacheManager
 
 logger = logging.getLogger("rssky.ai")
 
+# Response-format schemas sent to non-OpenAI endpoints; built once here so
+# _make_ai_request doesn't reconstruct the nested dicts on every call
+_SUMMARY_RESPONSE_FORMAT = {
+    "type": "object",
+    "properties": {
+        "importance": {"type": "number"},
+        "summary": {"type": "string"},
+        "impact": {"type": "string"},
+        "date": {"type": "string"}
+    },
+    "required": ["importance", "summary", "impact", "date"]
+}
+
+_REPORT_RESPONSE_FORMAT = {
+    "type": "object",
+    "properties": {
+        "stories": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "importance_rating": {"type": "number"},
+                    "summary": {"type": "string"},
+                    "date": {"type": "string"},
+                    "sources": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "title": {"type": "string"},
+                                "url": {"type": "string"}
+                            },
+                            "required": ["name", "title", "url"]
+                        }
+                    }
+                },
+                "required": ["title", "importance_rating", "summary", "date", "sources"]
+            }
+        }
+    },
+    "required": ["stories"]
+}
+
+# Translation table for building filesystem-safe debug file names; one
+# C-level translate pass instead of chained str.replace calls
+_ENTRY_NAME_TABLE = str.maketrans({" ": "_", "/": "_", ":": "_"})
+
+# Summary texts containing these markers are fallback/error summaries and
+# are always carried into the digest regardless of importance score
+_FALLBACK_MARKERS = ("API request failed", "could not be extracted")
+
+# Cap on article content sent to the AI, measured in UTF-8 bytes so the
+# budget tracks actual payload size rather than character count
+_MAX_CONTENT_BYTES = 20000
+
+
+def _backoff(attempt):
+    """Exponential backoff with jitter for retry delays, capped at 60s.
+
+    The jitter spreads concurrent workers' retries so a rate-limited
+    endpoint isn't hit by all of them at once.
+    """
+    return min(60, 2 ** attempt) * (0.5 + random.random())
+
+
+def _truncate_content(text):
+    """Cap text at _MAX_CONTENT_BYTES of UTF-8, marking the cut.
+
+    Encoding once and slicing bytes keeps multi-byte articles within the
+    same payload budget as ASCII ones; errors='ignore' drops any code
+    point split by the byte cut.
+    """
+    encoded = text.encode('utf-8')
+    if len(encoded) <= _MAX_CONTENT_BYTES:
+        return text
+    logger.info(f"Truncating content from {len(encoded)} to {_MAX_CONTENT_BYTES} bytes for AI processing")
+    return encoded[:_MAX_CONTENT_BYTES].decode('utf-8', errors='ignore') + "... [content truncated]"
+
+
+def _strip_think_blocks(s):
+    """Remove complete <think>...</think> spans from a response.
+
+    Reasoning models draft freely inside think tags, and a drafted JSON
+    object there can be perfectly valid — it must never win over the real
+    answer that follows. An unterminated block is left alone, since the
+    close tag may simply have been truncated away along with the answer.
+    """
+    start = s.find('<think>')
+    while start != -1:
+        end = s.find('</think>', start)
+        if end == -1:
+            break
+        s = s[:start] + s[end + len('</think>'):]
+        start = s.find('<think>', start)
+    return s
+
+
+def _find_json_span(s, pos=0):
+    """Find the first balanced {...} span in a string, starting at pos.
+
+    Walks the string once, tracking brace depth while skipping string
+    literals and escapes, so preambles like <think> blocks and trailing
+    junk after the JSON are both rejected in a single O(n) pass. Returns
+    (start, end) slice indices, or None if no balanced object exists.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+    for i, ch in enumerate(s[pos:], start=pos):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}':
+            if depth > 0:
+                depth -= 1
+                if depth == 0:
+                    return (start, i + 1)
+    return None
+
+
 class AIProcessor:
     """Handles AI processing for RSSky"""
     
-    def __init__(self, config, cache_manager):
+    def __init__(self, config, cache_manager, use_prompt_cache=True):
         """Initialize with configuration and cache manager"""
         self.config = config
         self.cache_manager = cache_manager
         self.api_config = config.get_api_config()
+        # Reuse responses for byte-identical prompts (wire stories and
+        # republishes produce them often); can be disabled per run
+        self.use_prompt_cache = use_prompt_cache
+        # OpenAI models don't support the response_format param; this never
+        # changes across calls, so decide once
+        self._is_openai = str(self.api_config['model']).strip().lower().startswith("gpt")
+        # Debug artifact dumps (prompts, raw responses, extracted JSON) are
+        # dead weight unless debug logging is on; decide once here and
+        # create the directory a single time instead of per call
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # Split the prompt templates around their placeholder once, so each
+        # entry costs a single concatenation instead of a full-template
+        # scan-and-replace
+        self._summary_prefix, _, self._summary_base_suffix = (
+            self.config.get_summary_prompt().strip().partition("{article_content}")
+        )
+        self._summary_suffix = (
+            self._summary_base_suffix +
+            "\n\nRespond ONLY with a valid JSON object, and do not include comments or explanations."
+        )
+        self._report_prefix, report_sep, self._report_suffix = (
+            self.config.get_report_prompt().partition("{summaries_json}")
+        )
+        self._report_has_placeholder = bool(report_sep)
+        # Retry-After from the most recent rate-limited response; retry
+        # loops honor it in place of the computed backoff. Thread-local so
+        # each summarize_entries worker waits for its own server answer
+        # instead of racing the others over one shared attribute
+        self._retry_state = threading.local()
+        self._debug_dir = Path("debug")
+        if self._debug_enabled:
+            self._debug_dir.mkdir(parents=True, exist_ok=True)
+        # Background thread for debug artifacts so their disk latency
+        # overlaps with the much longer API round trips
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rssky-ai-io")
+        # One pooled HTTP session for all API calls: keep-alive amortizes
+        # the TCP+TLS handshake across requests. The session retry covers
+        # connect failures only — no status or read retries — because a
+        # POST that died mid-read may already have been executed (and
+        # billed) server-side, and 429/5xx handling belongs to the
+        # application retry loops, which need to see each response to
+        # honor its Retry-After header; retrying here too would stack the
+        # two layers into up to ~12 POSTs per call
+        retry = Retry(
+            connect=3,
+            read=0,
+            backoff_factor=1,
+            allowed_methods=["POST"],
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @property
+    def _retry_after(self):
+        """Retry-After seen by the current thread's last response, if any"""
+        return getattr(self._retry_state, 'after', None)
+
+    @_retry_after.setter
+    def _retry_after(self, value):
+        self._retry_state.after = value
+
+    def _write_debug_async(self, path, text):
+        """Write a debug artifact on the background I/O thread.
+
+        The write proceeds while the caller carries on with the API call;
+        failures are logged but never fatal.
+        """
+        def _write():
+            try:
+                path.write_text(text, encoding="utf-8")
+            except Exception as e:
+                logger.warning(f"Failed writing debug file {path}: {e}")
+        self._io_executor.submit(_write)
     
     def get_entry_content(self, entry, feed_id, entry_id):
         """Helper method to get content using consistent IDs"""
@@ -47,7 +261,7 @@ class AIProcessor:
         """Generate an AI summary for a feed entry, with retry logic on parse failure"""
         entry_title = entry.get('title', 'Unknown') # Keep for logging
         try:
-            entry_id = CacheManager.create_entry_cache_key(entry)
+            entry_id = CacheManager.get_entry_cache_key(entry)
         except Exception as e:
             logger.error(f"Failed to create entry cache key for '{entry_title}': {e}", exc_info=True)
             return self._generate_fallback_summary(entry)
@@ -66,14 +280,6 @@ class AIProcessor:
                 logger.info(f"Using cached summary for: {feed_id}/{entry_id} ('{entry_title}')")
                 return cached_summary
         logger.info(f"No cached summary found, generating for: {feed_id}/{entry_id} ('{entry_title}')")
-        prompt = self.config.get_summary_prompt()
-        # Add strict instruction to avoid comments and explanations
-        prompt = (
-            prompt.strip() +
-            "\n\nRespond ONLY with a valid JSON object, and do not include comments or explanations."
-        )
-        if isinstance(content, list):
-            content = "\n".join([str(item) for item in content if item])
         # --- Ensure title and date are included in the prompt above the full text ---
         item_title = entry.get('title', 'Unknown')
         item_date = entry.get('published', entry.get('date', ''))
@@ -82,36 +288,49 @@ class AIProcessor:
         # Prepend title and date to the content
         content_header = f"Title: {item_title}\nDate: {item_date}\n\n"
         full_content = content_header + content
-        debug_dir = Path("debug")
-        if not debug_dir.exists():
-            os.makedirs(debug_dir)
-        entry_name = entry_title[:30].replace(" ", "_").replace("/", "_").replace(":", "_")
-        full_content_file = debug_dir / f"full_content_{entry_name}.txt"
-        full_content_file.write_text(full_content, encoding="utf-8")
-        ai_content = full_content
-        if len(full_content) > 20000:
-            logger.info(f"Truncating content from {len(full_content)} to 20000 characters for AI processing")
-            ai_content = full_content[:20000] + "... [content truncated]"
-        article_prompt = prompt.replace("{article_content}", ai_content)
-        summary_prompt_file = debug_dir / f"prompt_{entry_name}.txt"
-        summary_prompt_file.write_text(article_prompt, encoding="utf-8")
+        entry_name = entry_title[:30].translate(_ENTRY_NAME_TABLE)
+        if self._debug_enabled:
+            self._write_debug_async(self._debug_dir / f"full_content_{entry_name}.txt", full_content)
+        # Wire stories syndicated by several feeds arrive with byte-identical
+        # content; reuse the summary generated for the first copy instead of
+        # paying for another API call
+        content_hash = hashlib.blake2b(full_content.encode('utf-8'), digest_size=16).hexdigest()
+        if not force:
+            duplicate_summary = self.cache_manager.get_summary_by_content_hash(content_hash)
+            if duplicate_summary:
+                logger.info(f"Reusing summary for identical content: '{entry_title}'")
+                duplicate_summary['url'] = entry.get('link', '')
+                duplicate_summary['title'] = entry.get('title', '')
+                self.cache_manager.cache_summary(feed_id, entry_id, duplicate_summary)
+                return duplicate_summary
+        ai_content = _truncate_content(full_content)
+        article_prompt = f"{self._summary_prefix}{ai_content}{self._summary_suffix}"
+        if self._debug_enabled:
+            self._write_debug_async(self._debug_dir / f"prompt_{entry_name}.txt", article_prompt)
         # --- Retry logic for AI call and JSON extraction ---
         max_attempts = 3
         for attempt in range(1, max_attempts + 1):
+            if attempt > 1:
+                # Back off between attempts, honoring any Retry-After the
+                # server sent on the previous failure
+                time.sleep(self._retry_after or _backoff(attempt - 1))
             try:
                 # logger.info(f"Making AI request for: {entry_title} (attempt {attempt})")
-                raw_response, parsed_response = self._make_ai_request(article_prompt, entry_title, use_summary_schema=True)
+                # Retries re-issue the identical prompt, so a cached response
+                # the checks below already rejected would replay forever;
+                # bypass the cache read after the first attempt
+                raw_response, parsed_response = self._make_ai_request(
+                    article_prompt, entry_title, use_summary_schema=True,
+                    read_cache=(attempt == 1))
                 # --- INSTRUMENTATION: Log and save the raw_response at the earliest point ---
-                debug_dir = Path("debug")
-                debug_dir.mkdir(exist_ok=True)
-                raw_file = debug_dir / f"raw_ai_response_{entry_name}_attempt{attempt}.txt"
-                try:
-                    raw_file.write_text(str(raw_response), encoding="utf-8")
-                except Exception:
-                    pass
-                logger.debug(f"[DEBUG] Length of raw_response: {len(str(raw_response)) if raw_response else 0}")
-                # logger.debug(f"[DEBUG] Start of raw_response: {str(raw_response)[:500] if raw_response else ''}")
-                logger.debug(f"[DEBUG] End of raw_response: {str(raw_response)[-500:] if raw_response else ''}")
+                if self._debug_enabled:
+                    raw_file = self._debug_dir / f"raw_ai_response_{entry_name}_attempt{attempt}.txt"
+                    try:
+                        raw_file.write_text(str(raw_response), encoding="utf-8")
+                    except Exception:
+                        pass
+                    logger.debug(f"[DEBUG] Length of raw_response: {len(str(raw_response)) if raw_response else 0}")
+                    logger.debug(f"[DEBUG] End of raw_response: {str(raw_response)[-500:] if raw_response else ''}")
                 if parsed_response:
                     # Check if we got a fallback/error summary (by summary text)
                     summary_text = parsed_response.get("summary", "")
@@ -125,13 +344,14 @@ class AIProcessor:
                         else:
                             continue  # Retry
                     # Success: valid summary
-                    # logger.info(f"AI response for {entry_title}: {parsed_response}")
-                    response_file = debug_dir / f"response_{entry_name}.json"
-                    response_file.write_text(json.dumps(parsed_response, indent=2), encoding="utf-8")
+                    if self._debug_enabled:
+                        response_file = self._debug_dir / f"response_{entry_name}.json"
+                        response_file.write_bytes(orjson.dumps(parsed_response, option=orjson.OPT_INDENT_2))
                     parsed_response['url'] = entry.get('link', '')
                     parsed_response['title'] = entry.get('title', '')
                     parsed_response['full_content_available'] = True
                     self.cache_manager.cache_summary(feed_id, entry_id, parsed_response)
+                    self.cache_manager.cache_summary_by_content_hash(content_hash, parsed_response)
                     return parsed_response
                 else:
                     logger.warning(f"AI request returned no data for entry: {entry_title} (attempt {attempt})")
@@ -150,124 +370,209 @@ class AIProcessor:
         self.cache_manager.cache_summary(feed_id, entry_id, fallback_summary)
         return fallback_summary
     
+    def summarize_entries(self, pending, batch_size=10, max_workers=8):
+        """Summarize many entries through one concurrent request pool.
+
+        `pending` is a list of (entry, feed_id, feed_title) tuples. Entries
+        are grouped into batches of `batch_size` (one API call each) and the
+        batches run concurrently on a thread pool, so both the per-request
+        overhead and the API latency are amortized. Returns when every
+        summary has been generated and cached.
+        """
+        if not pending:
+            return
+
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        logger.info(f"Summarizing {len(pending)} entries in {len(batches)} batches")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.summarize_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                future.result()
+
+    def summarize_batch(self, batch):
+        """Generate AI summaries for several entries with a single API call.
+
+        `batch` is a list of (entry, feed_id, feed_title) tuples. The entries'
+        contents are combined into one prompt as numbered articles and the AI
+        is asked for a JSON object with one summary per article, which cuts
+        the number of API round trips roughly by the batch size. Results are
+        still cached per entry. Any entry the batched response doesn't cover
+        falls back to the per-entry summarize_entry path.
+        """
+        items = []
+        for entry, feed_id, feed_title in batch:
+            entry_title = entry.get('title', 'Unknown')
+            try:
+                entry_id = CacheManager.get_entry_cache_key(entry)
+            except Exception as e:
+                logger.error(f"Failed to create entry cache key for '{entry_title}': {e}", exc_info=True)
+                continue
+            content = self.get_entry_content(entry, feed_id, entry_id)
+            if not content:
+                # No content to batch; let the single-entry path handle the fallback
+                self.summarize_entry(entry, feed_id, feed_title)
+                continue
+            content = _truncate_content(content)
+            item_date = entry.get('published', entry.get('date', ''))
+            if not item_date:
+                item_date = datetime.now().strftime('%Y-%m-%d')
+            items.append({
+                'entry': entry,
+                'feed_id': feed_id,
+                'feed_title': feed_title,
+                'entry_id': entry_id,
+                'content': f"Title: {entry_title}\nDate: {item_date}\n\n{content}",
+            })
+
+        if not items:
+            return []
+
+        # Build one prompt containing all articles as numbered blocks
+        article_blocks = []
+        for idx, item in enumerate(items, start=1):
+            article_blocks.append(f"--- ARTICLE {idx} ---\n{item['content']}")
+        batch_content = "\n\n".join(article_blocks)
+
+        prompt = (
+            f"{self._summary_prefix}{batch_content}{self._summary_base_suffix}"
+            f"\n\nThe text above contains {len(items)} separate articles, delimited by"
+            " '--- ARTICLE N ---' markers. Analyze each article independently."
+            " Respond ONLY with a valid JSON object of the form"
+            ' {"summaries": [{"article": N, "importance": ..., "summary": ..., "impact": ..., "date": ...}, ...]}'
+            " with exactly one element per article, and do not include comments or explanations."
+        )
+
+        raw_response, parsed_response = self._make_ai_request(prompt)
+
+        summaries_by_index = {}
+        if parsed_response and isinstance(parsed_response, dict):
+            for summary in parsed_response.get('summaries', []):
+                if isinstance(summary, dict) and 'article' in summary:
+                    # Models answer "article": "1" as often as 1; coerce so
+                    # a string index doesn't silently miss every integer
+                    # lookup and dump the whole batch onto the fallback path
+                    try:
+                        summaries_by_index[int(summary['article'])] = summary
+                    except (TypeError, ValueError):
+                        logger.warning(f"Batch response has non-numeric article index: {summary['article']!r}")
+
+        results = []
+        for idx, item in enumerate(items, start=1):
+            summary = summaries_by_index.get(idx)
+            if summary:
+                entry = item['entry']
+                summary.pop('article', None)
+                summary['url'] = entry.get('link', '')
+                summary['title'] = entry.get('title', '')
+                summary['full_content_available'] = True
+                self.cache_manager.cache_summary(item['feed_id'], item['entry_id'], summary)
+                results.append(summary)
+            else:
+                # Batched response missed this article; retry it individually
+                logger.warning(f"Batch response missing summary for article {idx} "
+                               f"('{item['entry'].get('title', 'Unknown')}'), retrying individually")
+                results.append(self.summarize_entry(item['entry'], item['feed_id'], item['feed_title']))
+
+        return results
+
     def generate_digest(self, date_str, entries):
-        """Generate a daily digest of the most important entries."""
-        logger.info(f"Generating digest with {len(entries)} entries")
-        
+        """Generate a daily digest of the most important entries.
+
+        `entries` may be any iterable (including a generator); it is consumed
+        exactly once and only the selected summaries are retained.
+        """
+        logger.info("Generating digest")
+
         entries_with_summaries = []
-        
+        entry_count = 0
+        debug = self._debug_enabled
+
         for entry in entries:
+            entry_count += 1
+            title = entry.get('title', '')
+            url = entry.get('link', '')
+            published = entry.get('published', '')
             feed_title = entry.get('feed_title', '')
             feed_id = entry.get('feed_id', '')
             # --- FIX: Always use the same cache key logic as summary generation ---
             try:
-                entry_id = CacheManager.create_entry_cache_key(entry)
+                entry_id = CacheManager.get_entry_cache_key(entry)
             except Exception as e:
-                logger.error(f"Failed to create entry cache key for digest: {entry.get('title', 'Unknown')} ({feed_id}): {e}")
+                logger.error(f"Failed to create entry cache key for digest: {title or 'Unknown'} ({feed_id}): {e}")
                 continue
-            logger.debug(f"Processing entry for digest: {entry.get('title', 'Unknown')} from {feed_title}")
             # Get cached summary using feed_id and entry_id
             summary = self.cache_manager.get_entry_summary(feed_id, entry_id)
-            
-            if summary:
-                logger.debug(f"Found cached summary with importance: {summary.get('importance', 'Unknown')}")
-                
-                # Ensure importance is a number
-                importance = summary.get('importance', 0)
-                if isinstance(importance, str):
-                    try:
-                        importance = float(importance)
-                    except (ValueError, TypeError):
-                        importance = 5  # Default if we can't convert
-                
-                # Include summaries with importance >= 5 or fallback/error summaries
-                if importance >= 5 or "API request failed" in summary.get('summary', '') or "could not be extracted" in summary.get('summary', ''):
-                    logger.info(f"Adding entry to digest: {entry.get('title', 'Unknown')} with importance {importance}")
-                    
-                    # Ensure all required fields are present
-                    if 'title' not in summary:
-                        summary['title'] = entry.get('title', '')
-                    if 'date' not in summary:
-                        summary['date'] = entry.get('published', '')
-                    if 'url' not in summary:
-                        summary['url'] = entry.get('link', '')
-                    if 'feed' not in summary:
-                        summary['feed'] = feed_title
-                        
-                    entries_with_summaries.append({
-                        'title': entry.get('title', ''),
-                        'summary': summary,
-                        'date': entry.get('published', ''),
-                        'url': entry.get('link', ''),
-                        'feed': feed_title
-                    })
-                else:
-                    logger.debug(f"Skipping entry with low importance: {entry.get('title', 'Unknown')} - {importance}")
-            else:
-                logger.debug(f"No cached summary found for: {entry.get('title', 'Unknown')}")
+
+            if not summary:
+                if debug:
+                    logger.debug(f"No cached summary found for: {title or 'Unknown'}")
+                continue
+
+            # Ensure importance is a number
+            importance = summary.get('importance', 0)
+            if isinstance(importance, str):
+                try:
+                    importance = float(importance)
+                except (ValueError, TypeError):
+                    importance = 5  # Default if we can't convert
+
+            # Include summaries with importance >= 5 or fallback/error summaries
+            if importance >= 5 or any(marker in summary.get('summary', '') for marker in _FALLBACK_MARKERS):
+                if debug:
+                    logger.debug(f"Adding entry to digest: {title or 'Unknown'} with importance {importance}")
+
+                # Ensure all required fields are present
+                summary.setdefault('title', title)
+                summary.setdefault('date', published)
+                summary.setdefault('url', url)
+                summary.setdefault('feed', feed_title)
+
+                entries_with_summaries.append({
+                    'title': title,
+                    'summary': summary,
+                    'date': published,
+                    'url': url,
+                    'feed': feed_title
+                })
+            elif debug:
+                logger.debug(f"Skipping entry with low importance: {title or 'Unknown'} - {importance}")
         
-        logger.info(f"Found {len(entries_with_summaries)} significant entries for digest")
+        logger.info(f"Found {len(entries_with_summaries)} significant entries for digest "
+                    f"(scanned {entry_count})")
         
         if not entries_with_summaries:
             logger.warning("No significant entries found for digest")
             return {"high_impact": [], "significant": []}
         
         # Insert summary.json content directly, no wrapping or transformation
-        summaries_json = json.dumps(entries_with_summaries, indent=2, ensure_ascii=False)
+        summaries_json = orjson.dumps(entries_with_summaries, option=orjson.OPT_INDENT_2).decode("utf-8")
         
-        # Get the report prompt template
-        digest_prompt = self.config.get_report_prompt()
-        
-        # Replace placeholders
-        if "{summaries_json}" in digest_prompt:
-            digest_prompt = digest_prompt.replace("{summaries_json}", "###SUMMARIES_JSON###")
-            digest_prompt = digest_prompt.replace("###SUMMARIES_JSON###", summaries_json)
+        # Splice the summaries into the pre-split report template
+        if self._report_has_placeholder:
+            digest_prompt = f"{self._report_prefix}{summaries_json}{self._report_suffix}"
         else:
-            # Fallback for older templates
-            digest_prompt = f"{digest_prompt}\n\nHere are the summaries (each is a direct JSON object from summary.json):\n{summaries_json}"
+            # Fallback for older templates without the placeholder
+            digest_prompt = f"{self._report_prefix}\n\nHere are the summaries (each is a direct JSON object from summary.json):\n{summaries_json}"
         
         # Save the report prompt and response to debug dir for inspection
-        debug_dir = Path("debug")
-        debug_dir.mkdir(exist_ok=True)
-        report_prompt_file = debug_dir / f"report_prompt_{date_str}.txt"
-        report_prompt_file.write_text(digest_prompt, encoding="utf-8")
-        report_response_file = debug_dir / f"report_response_{date_str}.json"
+        report_response_file = self._debug_dir / f"report_response_{date_str}.json"
+        if self._debug_enabled:
+            self._write_debug_async(self._debug_dir / f"report_prompt_{date_str}.txt", digest_prompt)
         # (response will be written after AI call)
         
-        # Determine if using OpenAI model (skip schema injection)
-        api_conf = self.api_config
-        model = api_conf['model'].strip()
-        # Determine if using OpenAI model (which doesn't support response_format param)
-        is_openai = model.lower().startswith("gpt")
-        temperature = float(self.api_config['temperature'])
-        max_tokens = int(self.api_config['max_tokens'])
-        
-        # Prepare the request
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_conf['api_key']}"
-        }
-        
-        data = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": digest_prompt}
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens
-        }
-        
         # Inject response_format for Gemini/Google models only
-        schema_flag = not is_openai
+        schema_flag = not self._is_openai
         
         # Make the AI request with retry logic
         max_retries = 3
-        retry_delay = 3  # seconds
         attempt = 0
         while attempt < max_retries:
             try:
-                raw_response, parsed_response = self._make_ai_request(digest_prompt, use_report_schema=schema_flag)
+                # As in summarize_entry: a cached response that failed the
+                # 'stories' validation below must not be replayed on retry
+                raw_response, parsed_response = self._make_ai_request(
+                    digest_prompt, use_report_schema=schema_flag,
+                    read_cache=(attempt == 0))
                 # Map 'news' key to 'stories' if API returned it
                 if parsed_response and isinstance(parsed_response, dict):
                     if "news" in parsed_response:
@@ -276,33 +581,42 @@ class AIProcessor:
                     elif "newsStories" in parsed_response:
                         logger.warning("API response used 'newsStories' key; mapping to 'stories'")
                         parsed_response["stories"] = parsed_response.pop("newsStories")
-                # Always write the raw AI response to the debug file BEFORE any validation logic
-                try:
-                    report_response_file.write_text(str(raw_response), encoding="utf-8")
-                except Exception:
-                    pass
+                # Write the raw AI response to the debug file BEFORE any validation logic
+                if self._debug_enabled:
+                    try:
+                        report_response_file.write_text(str(raw_response), encoding="utf-8")
+                    except Exception:
+                        pass
                 # Accept only valid AI output (must be a dict with 'stories' key)
                 if parsed_response and isinstance(parsed_response, dict) and "stories" in parsed_response:
                     return parsed_response
                 else:
                     logger.warning(f"Attempt {attempt+1}: Invalid AI response for digest (missing 'stories'). Retrying...")
             except Exception as e:
-                logger.error(f"Attempt {attempt+1}: Exception during AI request for digest: {e}")
-                logger.error(f"Exception details: {traceback.format_exc()}")
-                try:
-                    report_response_file.write_text(f"AI request failed: {str(e)}\n{traceback.format_exc()}", encoding="utf-8")
-                except Exception:
-                    pass
+                # logger.exception defers traceback formatting to the
+                # handler; the full string is only built in debug mode
+                logger.exception(f"Attempt {attempt+1}: Exception during AI request for digest")
+                if self._debug_enabled:
+                    try:
+                        report_response_file.write_text(f"AI request failed: {str(e)}\n{traceback.format_exc()}", encoding="utf-8")
+                    except Exception:
+                        pass
             attempt += 1
             if attempt < max_retries:
-                import time
-                time.sleep(retry_delay)
+                # Exponential backoff with jitter, honoring any Retry-After
+                # the server sent on the failed attempt
+                time.sleep(self._retry_after or _backoff(attempt))
         # If all retries fail, log critical error and abort
         logger.critical("All attempts to generate digest via AI failed. Aborting digest generation.")
         raise RuntimeError("Failed to generate digest via AI after multiple attempts.")
     
-    def _make_ai_request(self, prompt, entry_title=None, use_report_schema=False, use_summary_schema=False):
-        """Make an API request to the AI service"""
+    def _make_ai_request(self, prompt, entry_title=None, use_report_schema=False, use_summary_schema=False, read_cache=True):
+        """Make an API request to the AI service.
+
+        read_cache=False skips the prompt-cache lookup (the fresh response
+        is still stored); retry loops pass it so a cached response their
+        validation already rejected isn't replayed on every attempt.
+        """
         try:
             # Get API configuration
             api_url = self.api_config['api_url']
@@ -316,8 +630,7 @@ class AIProcessor:
                     
             api_key = self.api_config['api_key']
             model = self.api_config['model'].strip()
-            # Determine if using OpenAI model (which doesn't support response_format param)
-            is_openai = model.lower().startswith("gpt")
+            is_openai = self._is_openai
             temperature = float(self.api_config['temperature'])
             max_tokens = int(self.api_config['max_tokens'])
             
@@ -336,64 +649,37 @@ class AIProcessor:
                 "temperature": temperature,
                 "max_tokens": max_tokens
             }
+
+            # Identical prompts (same model and temperature) produce reusable
+            # answers; check the prompt cache before paying for the request
+            prompt_key = None
+            if self.use_prompt_cache:
+                key_material = f"{model}|{temperature}|{prompt}".encode('utf-8')
+                prompt_key = hashlib.blake2b(key_material, digest_size=16).hexdigest()
+                if read_cache:
+                    cached_response = self.cache_manager.get_prompt_response(prompt_key)
+                    if cached_response is not None:
+                        logger.info("Prompt cache hit, skipping API request")
+                        return (cached_response.get('content'), cached_response.get('parsed'))
             
             # Inject response_format for Gemini/Google models only
             if use_report_schema and not is_openai:
-                response_format = {
-                    "type": "object",
-                    "properties": {
-                        "stories": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "title": {"type": "string"},
-                                    "importance_rating": {"type": "number"},
-                                    "summary": {"type": "string"},
-                                    "date": {"type": "string"},
-                                    "sources": {
-                                        "type": "array",
-                                        "items": {
-                                            "type": "object",
-                                            "properties": {
-                                                "name": {"type": "string"},
-                                                "title": {"type": "string"},
-                                                "url": {"type": "string"}
-                                            },
-                                            "required": ["name", "title", "url"]
-                                        }
-                                    }
-                                },
-                                "required": ["title", "importance_rating", "summary", "date", "sources"]
-                            }
-                        }
-                    },
-                    "required": ["stories"]
-                }
-                # Try Gemini/Google-style schema param, fallback to OpenAI function calling if needed
-                data["response_format"] = response_format
-            
+                data["response_format"] = _REPORT_RESPONSE_FORMAT
+
             # Inject response_format for summary calls
             if use_summary_schema and not is_openai:
-                summary_format = {
-                    "type": "object",
-                    "properties": {
-                        "importance": {"type": "number"},
-                        "summary": {"type": "string"},
-                        "impact": {"type": "string"},
-                        "date": {"type": "string"}
-                    },
-                    "required": ["importance", "summary", "impact", "date"]
-                }
-                data["response_format"] = summary_format
+                data["response_format"] = _SUMMARY_RESPONSE_FORMAT
             
             # Make the request
             logger.info(f"Making API request to {api_url} with model {model}")
-            response = requests.post(api_url, headers=headers, json=data)
+            response = self._session.post(api_url, headers=headers, json=data, timeout=60)
             
             # Check if the request was successful
             if response.status_code == 200:
-                result = response.json()
+                self._retry_after = None
+                # orjson parses the raw bytes directly, skipping requests'
+                # encoding detection and the slower stdlib decoder
+                result = orjson.loads(response.content)
                 
                 # Extract the content from the response
                 if 'choices' in result and len(result['choices']) > 0:
@@ -403,73 +689,89 @@ class AIProcessor:
                     return (None, None)
                 
                 # Save raw content for debugging
-                debug_dir = Path("debug")
-                if not debug_dir.exists():
-                    os.makedirs(debug_dir)
-                raw_response_file = debug_dir / "raw_content.txt"
-                raw_response_file.write_text(content, encoding="utf-8")
-                
-                # Log the raw content
-                # logger.info(f"Raw content from API: {content[:100]}...")
-                
-                # Extract JSON from content
-                json_str = self._extract_json_from_string(content, entry_title, prompt)
-                
-                if not json_str:
+                if self._debug_enabled:
+                    self._write_debug_async(self._debug_dir / "raw_content.txt", content)
+
+                # Extract and parse the JSON from the content in one step
+                parsed_result = self._extract_json_from_string(content, entry_title, prompt)
+
+                if parsed_result is None:
                     logger.error(f"Could not extract JSON from API response. Raw content was: {content}")
                     return (content, None)
-                
+
                 # Save extracted JSON for debugging
-                json_file = debug_dir / f"extracted_json_{datetime.now().strftime('%Y%m%d%H%M%S')}.txt"
-                json_file.write_text(json_str, encoding="utf-8")
-                
-                # Try to parse the JSON
-                try:
-                    parsed_result = json.loads(json_str)
-                    logger.info(f"Successfully parsed JSON with keys: {list(parsed_result.keys())}")
-                    return (content, parsed_result)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse JSON: {str(e)}")
-                    return (content, None)
+                if self._debug_enabled:
+                    json_file = self._debug_dir / f"extracted_json_{datetime.now().strftime('%Y%m%d%H%M%S')}.txt"
+                    self._write_debug_async(json_file, orjson.dumps(parsed_result, option=orjson.OPT_INDENT_2).decode("utf-8"))
+
+                logger.info(f"Successfully parsed JSON with keys: {list(parsed_result.keys())}")
+
+                if prompt_key is not None:
+                    self.cache_manager.cache_prompt_response(prompt_key, {
+                        'content': content,
+                        'parsed': parsed_result,
+                    })
+
+                return (content, parsed_result)
             else:
+                # Remember Retry-After so the callers' retry loops can wait
+                # exactly as long as the server asked instead of guessing
+                try:
+                    self._retry_after = float(response.headers.get('Retry-After', '') or 0) or None
+                except ValueError:
+                    self._retry_after = None
                 # Log the full error message and response text
                 logger.error(f"API request failed with status code {response.status_code}")
                 return (f"API request failed with status code {response.status_code}: {response.text}", None)
         except Exception as e:
-            logger.error(f"Exception during API request: {e}")
-            logger.error(traceback.format_exc())
-            return (f"Exception during API request: {e}\n{traceback.format_exc()}", None)
+            # Let the logging handler format the traceback; building the
+            # multi-KB string eagerly on every transient network error is
+            # wasted work, so only materialize it for debug runs
+            logger.exception("API request failed")
+            if self._debug_enabled:
+                return (f"Exception during API request: {e}\n{traceback.format_exc()}", None)
+            return (f"Exception during API request: {e}", None)
     
     def _extract_json_from_string(self, s, entry_title=None, prompt=None):
-        """Extract JSON from a string that may contain <think> tags, markdown code blocks, or plain JSON, and strip comments and invalid control characters. Save failed extractions."""
-        import re
-        s = s.strip()
-        
-        # Find the start of the JSON object
+        """Extract and parse the JSON object embedded in an AI response that
+        may contain <think> tags, markdown code blocks, or plain JSON.
+
+        Returns the parsed object, or None if no JSON could be recovered.
+        """
+        # Drop think spans first: a drafted JSON object inside one can be
+        # valid and would otherwise be returned as the answer
+        s = _strip_think_blocks(s).strip()
+
+        # Fast path: walk the balanced {...} spans and return the first one
+        # that parses; schema-enforced responses match on the first span
+        # almost every time, and orjson parses them natively.
+        pos = 0
+        while True:
+            span = _find_json_span(s, pos)
+            if span is None:
+                break
+            try:
+                return orjson.loads(s[span[0]:span[1]])
+            except orjson.JSONDecodeError:
+                pos = span[0] + 1
+
+        # No balanced span parsed cleanly (likely malformed or truncated
+        # output); fall back to the widest brace-to-brace slice and let
+        # demjson3 try to repair it
         start_brace = s.find('{')
-        if start_brace == -1:
-            logger.error("Could not find starting brace '{' in AI response.")
-            return ""
-            
-        # Find the end of the JSON object
         end_brace = s.rfind('}')
-        if end_brace == -1:
-            logger.error("Could not find ending brace '}' in AI response.")
-            return ""
-            
+        if start_brace == -1 or end_brace == -1:
+            logger.error("Could not find a JSON object in AI response.")
+            return None
         json_str = s[start_brace:end_brace+1]
-        
-        # Use demjson3 for robust parsing
+
+        # Fall back to demjson3, which tolerates comments, trailing commas
+        # and stray control characters but is pure Python and very slow
         try:
-            cleaned_obj = demjson3.decode(json_str)
-            # Re-encode to ensure it's a clean JSON string
-            json_str = demjson3.encode(cleaned_obj)
-            logger.debug(f"[DEBUG] demjson3 sanitized JSON string for parsing: {repr(json_str[:1000])}")
+            return demjson3.decode(json_str)
         except Exception as e:
-            logger.error(f"[DEBUG] demjson3 failed to decode extracted JSON: {e}")
-            return ""
-            
-        return json_str
+            logger.error(f"demjson3 failed to decode extracted JSON: {e}")
+            return None
     
     def _generate_fallback_summary(self, entry):
         """Generate a fallback summary when AI processing fails"""
@@ -488,8 +790,16 @@ class AIProcessor:
         if entry_date:
             try:
                 if isinstance(entry_date, str):
-                    # Parse string date
-                    date_obj = parser.parse(entry_date)
+                    # Try the C-implemented stdlib parsers first; feeds are
+                    # almost always ISO-8601 or RFC-2822, so the slow
+                    # general-purpose dateutil parser is a last resort
+                    try:
+                        date_obj = datetime.fromisoformat(entry_date.replace('Z', '+00:00'))
+                    except ValueError:
+                        try:
+                            date_obj = email.utils.parsedate_to_datetime(entry_date)
+                        except Exception:
+                            date_obj = parser.parse(entry_date)
                     formatted_date = date_obj.strftime("%Y-%m-%d")
                 else:
                     # Already a datetime object
@@ -4,27 +4,117 @@ Cache Manager module for RSSky
 This module handles caching of feed data, article content, and AI summaries.
 It provides methods to read from and write to the cache, check cache validity,
 and clear the cache when needed.
+
+The cache is deliberately a plain directory tree (one directory per feed,
+one per entry, with rawfeed.json.gz / fulltext.txt / summary.json inside)
+rather than a database file: the layout is human-inspectable, trivially
+diffable, and safe to prune with ordinary shell tools. Syscall pressure on
+the hot paths is kept down with in-process memoization instead.
 """
 
 import os
-import json
+import gzip
+import orjson
 import shutil
 import logging
 import hashlib
 import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from rssky.utils.helpers import safe_filename
 
 logger = logging.getLogger("rssky.cache")
 
+# Upper bound on memoized path-existence answers; old entries are evicted
+# LRU-style so a very long run cannot grow the map without limit
+_EXISTS_CACHE_MAX = 10000
+
+
+def _atomic_write_bytes(path, data):
+    """Write bytes via a sibling temp file and an atomic rename.
+
+    A crash mid-write leaves either the old file or the new one, never a
+    truncated half that would make the next run treat the cache entry as
+    corrupt and refetch.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=256)
+def _feed_id(feed_url, feed_title, legacy_hash=False):
+    """Compute a feed identifier; memoized since the same feed is keyed on
+    every fetch, summary and cleanup pass within a run.
+
+    blake2b with a short digest replaces truncated SHA1: same id length,
+    one compression round instead of 80. legacy_hash=True keeps the SHA1
+    scheme so pre-existing cache directories still resolve.
+    """
+    if legacy_hash:
+        if feed_title:
+            url_hash = hashlib.sha1(feed_url.encode()).hexdigest()[:8]
+            return f"{safe_filename(feed_title)}_{url_hash}"
+        return hashlib.sha1(feed_url.encode()).hexdigest()
+    if feed_title:
+        safe_title = safe_filename(feed_title)
+        url_hash = hashlib.blake2b(feed_url.encode('utf-8'), digest_size=4).hexdigest()
+        return f"{safe_title}_{url_hash}"
+    # Fallback hash-only id for feeds without a title; 20-byte digest keeps
+    # the historical 40-hex-char length
+    return hashlib.blake2b(feed_url.encode('utf-8'), digest_size=20).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _entry_key(title, unique_part):
+    """Compute an entry cache key; memoized so repeated keying of the same
+    (title, link) pair costs a dict lookup instead of sanitization + hash."""
+    if not title:
+        # Fallback if title is missing
+        base_key = unique_part if unique_part else 'missing_id'
+        if '/' in base_key:  # Try to get a filename/video ID from URL
+            base_key = base_key.split('/')[-1]
+            if '=' in base_key:  # Handle youtube ?v= URLs
+                base_key = base_key.split('=')[-1]
+        # blake2b is much faster than SHA1 on short inputs and a 4-byte
+        # digest gives the same 8 hex chars the key format already used;
+        # cryptographic strength is irrelevant for cache keys
+        key_hash = hashlib.blake2b(base_key.encode('utf-8'), digest_size=4).hexdigest()
+        sanitized_key = f"entry_{key_hash}"
+        logger.warning(f"Entry missing title, using fallback key: {sanitized_key} (from {unique_part})")
+        return sanitized_key
+    # Use sanitized title + hash of unique part
+    sanitized_title = safe_filename(title)
+    title_hash = hashlib.blake2b(unique_part.encode('utf-8'), digest_size=4).hexdigest()
+    return f"{sanitized_title}_{title_hash}"
+
 class CacheManager:
     """Manages the caching system for RSSky"""
     
-    def __init__(self, cache_dir="cache", retention_days=7, clear_cache=False):
+    def __init__(self, cache_dir="cache", retention_days=7, clear_cache=False, legacy_hash=False):
         """Initialize the cache manager"""
         self.cache_dir = Path(cache_dir)
         self.retention_days = retention_days
-        
+        # Resolve feed ids with the old SHA1 scheme when a pre-existing
+        # cache tree must keep working
+        self.legacy_hash = legacy_hash
+        # In-memory map of Path -> bool so repeated existence probes (both
+        # hits and misses) within a run don't each cost a stat() syscall;
+        # writes and deletions update it in place
+        self._exists_cache = OrderedDict()
+        # Per-feed index of cached entry files, built with a single scandir
+        # pass the first time a feed's entries are probed; batched runs then
+        # answer content/summary lookups without touching the filesystem
+        self._index_cache = {}
+        # One CacheManager is shared by the prefetch, fetch_many and
+        # summarize thread pools; the read-then-mutate sequences on the
+        # two in-memory caches are not GIL-atomic, so serialize them
+        self._mem_lock = threading.Lock()
+
+
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
@@ -38,17 +128,71 @@ class CacheManager:
     
     def generate_feed_id(self, feed_url, feed_title=None):
         """Generate a safe identifier for a feed URL"""
-        # If a feed title is provided, use it to create a human-readable identifier
-        if feed_title:
-            # Create a safe filename from the feed title
-            safe_title = safe_filename(feed_title)
-            # Ensure uniqueness by appending a shortened hash of the URL
-            url_hash = hashlib.sha1(feed_url.encode()).hexdigest()[:8]
-            return f"{safe_title}_{url_hash}"
-        else:
-            # Fallback to the original hash method for backward compatibility
-            return hashlib.sha1(feed_url.encode()).hexdigest()
+        return _feed_id(feed_url or '', feed_title or None, self.legacy_hash)
     
+    def _path_exists(self, path):
+        """Memoized Path.exists(): one stat per path per run, hit or miss"""
+        with self._mem_lock:
+            cached = self._exists_cache.get(path)
+            if cached is not None:
+                self._exists_cache.move_to_end(path)
+                return cached
+        # stat() outside the lock so a slow disk doesn't serialize the pools
+        exists = path.exists()
+        with self._mem_lock:
+            self._exists_cache[path] = exists
+            if len(self._exists_cache) > _EXISTS_CACHE_MAX:
+                self._exists_cache.popitem(last=False)
+        return exists
+
+    def _note_path(self, path, exists):
+        """Record a known existence state after a write or deletion"""
+        with self._mem_lock:
+            self._exists_cache[path] = exists
+            self._exists_cache.move_to_end(path)
+
+    def build_entry_index(self, feed_id):
+        """Map entry_id -> set of cached filenames for one feed.
+
+        One scandir pass over the feed directory replaces a stat per
+        content/summary probe; the index is cached and kept current by the
+        cache writers.
+        """
+        with self._mem_lock:
+            index = self._index_cache.get(feed_id)
+        if index is not None:
+            return index
+        # Scan outside the lock; different feeds build their indexes in
+        # parallel and a racing duplicate scan is harmless
+        index = {}
+        feed_dir = self.get_feed_cache_path(feed_id)
+        try:
+            with os.scandir(feed_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        try:
+                            index[entry.name] = set(os.listdir(entry.path))
+                        except FileNotFoundError:
+                            pass
+        except FileNotFoundError:
+            pass
+        with self._mem_lock:
+            # Keep whichever copy landed first so concurrent writers that
+            # already updated it via _index_note aren't overwritten
+            return self._index_cache.setdefault(feed_id, index)
+
+    def _index_note(self, feed_id, entry_id, filename, present):
+        """Keep an already-built feed index in sync after a write/delete"""
+        with self._mem_lock:
+            index = self._index_cache.get(feed_id)
+            if index is None:
+                return
+            files = index.setdefault(entry_id, set())
+            if present:
+                files.add(filename)
+            else:
+                files.discard(filename)
+
     @staticmethod
     def _generate_sanitized_path_component(text):
         """Generate a filesystem-safe component from text, reusing safe_filename."""
@@ -63,23 +207,21 @@ class CacheManager:
         """
         title = entry.get('title')
         unique_part = entry.get('link') or entry.get('id', '')
+        return _entry_key(title or '', unique_part or '')
 
-        if not title:
-            # Fallback if title is missing
-            base_key = unique_part if unique_part else 'missing_id'
-            if '/' in base_key: # Try to get a filename/video ID from URL
-                base_key = base_key.split('/')[-1]
-                if '=' in base_key: # Handle youtube ?v= URLs
-                    base_key = base_key.split('=')[-1]
-            key_hash = hashlib.sha1(base_key.encode('utf-8')).hexdigest()[:8]
-            sanitized_key = f"entry_{key_hash}"
-            logger.warning(f"Entry missing title, using fallback key: {sanitized_key} (from {unique_part})")
-            return sanitized_key
-        else:
-            # Use sanitized title + hash of unique part
-            sanitized_title = CacheManager._generate_sanitized_path_component(title)
-            title_hash = hashlib.sha1(unique_part.encode('utf-8')).hexdigest()[:8]
-            return f"{sanitized_title}_{title_hash}"
+    @staticmethod
+    def get_entry_cache_key(entry):
+        """
+        Memoizing wrapper around create_entry_cache_key: the key is derived
+        from a hash of entry fields, so stash it on the entry dict and reuse
+        it — the same entry is keyed on the prefetch, summary and digest
+        paths within one run.
+        """
+        key = entry.get('_cache_key')
+        if key is None:
+            key = CacheManager.create_entry_cache_key(entry)
+            entry['_cache_key'] = key
+        return key
 
     # Remove or comment out the old generate_entry_id
     # def generate_entry_id(self, entry):
@@ -119,10 +261,10 @@ class CacheManager:
         return feed_path / entry_id # Directory name is the entry_id
     
     def get_rawfeed_path(self, feed_id):
-        """Get the path to the cached raw feed data"""
+        """Get the path to the cached raw feed data (gzip-compressed)"""
         feed_dir = self.get_feed_cache_path(feed_id)
         feed_dir.mkdir(parents=True, exist_ok=True)
-        return feed_dir / "rawfeed.json"
+        return feed_dir / "rawfeed.json.gz"
     
     def get_content_path(self, feed_id, entry_id):
         """Get the path to the cached full text of an entry"""
@@ -139,40 +281,71 @@ class CacheManager:
         cache_data = {
             "timestamp": datetime.datetime.now().timestamp(),
             "feed_title": feed_data.get('feed', {}).get('title', 'Unknown Feed'),
-            "entries": feed_data.get('entries', [])
+            "entries": feed_data.get('entries', []),
+            # HTTP validators for conditional refetches once the cache
+            # goes stale
+            "etag": feed_data.get('etag'),
+            "modified": feed_data.get('modified'),
         }
         
         feed_path = self.get_rawfeed_path(feed_id)
-        with open(feed_path, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
-        
+        # orjson writes UTF-8 bytes directly and is several times faster
+        # than the stdlib encoder on large feedparser entry lists; raw feed
+        # payloads are highly repetitive HTML so even the fastest gzip level
+        # shrinks them several-fold. default=list keeps the time.struct_time
+        # values feedparser puts in *_parsed serializable (stdlib json
+        # accepted them as tuple subclasses; orjson only takes exact tuples)
+        payload = gzip.compress(
+            orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS, default=list),
+            compresslevel=1)
+        _atomic_write_bytes(feed_path, payload)
+        self._note_path(feed_path, True)
+
         logger.debug(f"Cached feed data: {feed_id}")
         return cache_data
     
     def get_cached_feed(self, feed_id, max_age_hours=6):
-        """Get cached feed data if it exists and is not too old"""
+        """Get cached feed data if it exists and is not too old.
+
+        Pass max_age_hours=None to skip the age check entirely, e.g. to
+        recover the stored HTTP validators for a conditional refetch.
+        """
         feed_path = self.get_rawfeed_path(feed_id)
-        
-        if not feed_path.exists():
-            return None
-        
+
         try:
-            with open(feed_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # Check if cache is too old
-            cache_time = cache_data.get('timestamp', 0)
-            cache_age = datetime.datetime.now().timestamp() - cache_time
-            max_age_seconds = max_age_hours * 3600
-            
-            if cache_age > max_age_seconds:
-                logger.debug(f"Feed cache too old: {feed_id}")
-                return None
+            if self._path_exists(feed_path):
+                read_path = feed_path
+                with gzip.open(feed_path, 'rb') as f:
+                    cache_data = orjson.loads(f.read())
+            else:
+                # Caches written before compression was added are plain
+                # rawfeed.json files; read them transparently
+                legacy_path = feed_path.with_suffix('')
+                if not self._path_exists(legacy_path):
+                    return None
+                read_path = legacy_path
+                cache_data = orjson.loads(legacy_path.read_bytes())
+
+            # Check if cache is too old. The file mtime is stamped by the
+            # atomic writer at the same moment the internal timestamp is
+            # recorded, and being filesystem-visible it can be aged with a
+            # plain utime; the stored field remains the fallback
+            if max_age_hours is not None:
+                try:
+                    cache_time = read_path.stat().st_mtime
+                except OSError:
+                    cache_time = cache_data.get('timestamp', 0)
+                cache_age = datetime.datetime.now().timestamp() - cache_time
+                max_age_seconds = max_age_hours * 3600
+
+                if cache_age > max_age_seconds:
+                    logger.debug(f"Feed cache too old: {feed_id}")
+                    return None
             
             logger.debug(f"Using cached feed data: {feed_id}")
             return cache_data
             
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.error(f"Error reading cached feed: {e}")
             return None
     
@@ -182,10 +355,9 @@ class CacheManager:
         entry_dir = content_path.parent # Use helper
         try:
             os.makedirs(entry_dir, exist_ok=True)
-            # Ensure content is string before writing
-            with open(content_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        
+            _atomic_write_bytes(content_path, content.encode('utf-8'))
+            self._note_path(content_path, True)
+            self._index_note(feed_id, entry_id, "fulltext.txt", True)
             logger.debug(f"Cached entry content: {feed_id}/{entry_id}")
             return content
             
@@ -193,20 +365,19 @@ class CacheManager:
             logger.error(f"Error caching content {content_path}: {e}")
     
     def get_cached_content(self, feed_id, entry_id):
-        """Get cached content if it exists"""
-        content_path = self.get_content_path(feed_id, entry_id)
-        
-        if not content_path.exists():
+        """Get cached content if it exists; always returns str or None"""
+        if "fulltext.txt" not in self.build_entry_index(feed_id).get(entry_id, ()):
             return None
+        content_path = self.get_content_path(feed_id, entry_id)
         
         try:
-            with open(content_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            # Single-shot read + one decode pass instead of buffered 8KB
+            # chunks; transcripts can run to hundreds of KB
+            content = content_path.read_text(encoding='utf-8', errors='replace')
             logger.debug(f"Using cached content: {feed_id}/{entry_id}")
             return content
-            
-        except IOError as e:
+
+        except OSError as e:
             logger.error(f"Error reading cached content: {e}")
             return None
     
@@ -216,9 +387,12 @@ class CacheManager:
         entry_dir = summary_path.parent # Use helper
         try:
             os.makedirs(entry_dir, exist_ok=True)
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, ensure_ascii=False, indent=2)
-        
+            # orjson serializes straight to UTF-8 bytes, several times faster
+            # than the stdlib encoder; this runs once per summarized entry
+            _atomic_write_bytes(summary_path, orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
+            self._note_path(summary_path, True)
+            self._index_note(feed_id, entry_id, "summary.json", True)
+
             logger.debug(f"Cached entry summary: {feed_id}/{entry_id}")
             return summary_data
             
@@ -227,50 +401,150 @@ class CacheManager:
     
     def get_entry_summary(self, feed_id, entry_id):
         """Get cached summary if it exists"""
-        summary_path = self.get_summary_path(feed_id, entry_id)
-        
-        if not summary_path.exists():
+        if "summary.json" not in self.build_entry_index(feed_id).get(entry_id, ()):
             return None
+        summary_path = self.get_summary_path(feed_id, entry_id)
         
         try:
-            with open(summary_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(summary_path.read_bytes())
         except Exception as e:
             logger.error(f"Error reading cached summary: {e}")
             return None
     
+    def get_prompt_cache_path(self, prompt_key):
+        """Get the path to a cached prompt response"""
+        prompt_dir = self.cache_dir / "prompts"
+        prompt_dir.mkdir(parents=True, exist_ok=True)
+        return prompt_dir / f"{prompt_key}.json"
+
+    def get_prompt_response(self, prompt_key):
+        """Get a cached AI response for a prompt key if one exists"""
+        prompt_path = self.get_prompt_cache_path(prompt_key)
+
+        if not self._path_exists(prompt_path):
+            return None
+
+        try:
+            return orjson.loads(prompt_path.read_bytes())
+        except Exception as e:
+            logger.error(f"Error reading cached prompt response: {e}")
+            return None
+
+    def cache_prompt_response(self, prompt_key, response_data):
+        """Cache an AI response under its prompt key"""
+        prompt_path = self.get_prompt_cache_path(prompt_key)
+        try:
+            prompt_path.write_bytes(orjson.dumps(response_data))
+            self._note_path(prompt_path, True)
+            logger.debug(f"Cached prompt response: {prompt_key}")
+        except Exception as e:
+            logger.error(f"Error caching prompt response {prompt_path}: {e}")
+
+    def get_content_hash_path(self, content_hash):
+        """Get the path to a summary cached under a content hash"""
+        hash_dir = self.cache_dir / "by-content"
+        hash_dir.mkdir(parents=True, exist_ok=True)
+        return hash_dir / f"{content_hash}.json"
+
+    def get_summary_by_content_hash(self, content_hash):
+        """Get a cached summary for identical article content if one exists"""
+        hash_path = self.get_content_hash_path(content_hash)
+
+        if not self._path_exists(hash_path):
+            return None
+
+        try:
+            return orjson.loads(hash_path.read_bytes())
+        except Exception as e:
+            logger.error(f"Error reading content-hash summary: {e}")
+            return None
+
+    def cache_summary_by_content_hash(self, content_hash, summary_data):
+        """Cache a summary under the hash of the content it summarizes"""
+        hash_path = self.get_content_hash_path(content_hash)
+        try:
+            hash_path.write_bytes(orjson.dumps(summary_data))
+            self._note_path(hash_path, True)
+            logger.debug(f"Cached summary by content hash: {content_hash}")
+        except Exception as e:
+            logger.error(f"Error caching content-hash summary {hash_path}: {e}")
+
     def has_entry_summary(self, feed_id, entry_id):
         """Check if a summary is cached for an entry"""
-        summary_path = self.get_summary_path(feed_id, entry_id)
-        return summary_path.exists()
-    
+        return "summary.json" in self.build_entry_index(feed_id).get(entry_id, ())
+
     def clear_entry_summary(self, feed_id, entry_id):
         """Clear the cached summary for an entry"""
         summary_path = self.get_summary_path(feed_id, entry_id)
-        
-        if summary_path.exists():
+
+        if self._path_exists(summary_path):
             try:
                 summary_path.unlink()
+                self._note_path(summary_path, False)
+                self._index_note(feed_id, entry_id, "summary.json", False)
                 logger.debug(f"Cleared entry summary: {feed_id}/{entry_id}")
                 return True
             except Exception as e:
                 logger.error(f"Error clearing entry summary: {e}")
         return False
-    
+
     def clear_feed_cache(self, feed_id):
         """Clear cached data for a specific feed"""
         feed_dir = self.get_feed_cache_path(feed_id)
         if feed_dir.exists():
             shutil.rmtree(feed_dir)
+            with self._mem_lock:
+                self._exists_cache.clear()
+                self._index_cache.pop(feed_id, None)
             logger.info(f"Cleared cache for feed: {feed_id}")
-    
+
     def clear_all_cache(self):
         """Clear the entire cache"""
         for item in self.cache_dir.iterdir():
             if item.is_dir():
                 shutil.rmtree(item)
+        with self._mem_lock:
+            self._exists_cache.clear()
+            self._index_cache.clear()
         logger.info("Cleared all cache data")
     
+    def _clean_feed_dir(self, feed_entry, cutoff_timestamp):
+        """Remove aged items under one cache subdirectory.
+
+        feed_entry is an os.DirEntry for either a feed directory (entry
+        subdirectories removed by mtime) or one of the flat hash-keyed
+        stores (files removed by mtime). Returns the number removed.
+        """
+        cleaned = 0
+        # Prompt-response and content-hash cache entries are flat files
+        # keyed by hash; age them out by mtime like entry directories
+        if feed_entry.name in ("prompts", "by-content"):
+            with os.scandir(feed_entry.path) as files:
+                for cache_file in files:
+                    try:
+                        if cache_file.is_file(follow_symlinks=False) and \
+                                cache_file.stat(follow_symlinks=False).st_mtime < cutoff_timestamp:
+                            os.unlink(cache_file.path)
+                            cleaned += 1
+                    except FileNotFoundError:
+                        pass
+            return cleaned
+        with os.scandir(feed_entry.path) as entries:
+            for entry_dir in entries:
+                if not entry_dir.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    if entry_dir.stat(follow_symlinks=False).st_mtime < cutoff_timestamp:
+                        logger.info(f"Removing old cache directory: {entry_dir.path}")
+                        shutil.rmtree(entry_dir.path)
+                        cleaned += 1
+                except FileNotFoundError:
+                    # Directory might have been removed in a previous run or concurrently
+                    logger.warning(f"Cache directory not found during cleanup: {entry_dir.path}")
+                except Exception as e:
+                    logger.error(f"Error cleaning cache directory {entry_dir.path}: {e}", exc_info=True)
+        return cleaned
+
     # Renamed method and added optional days_to_keep argument
     def clean_old_cache(self, days_to_keep=None):
         """Clean up cache entries older than the specified retention period."""
@@ -283,34 +557,30 @@ class CacheManager:
 
         cleaned_count = 0
         try:
-            # Iterate through feed directories
-            for feed_dir in self.cache_dir.iterdir():
-                logger.debug(f"Checking feed directory: {feed_dir}")
-                if feed_dir.is_dir():
-                    # Iterate through entry directories within each feed directory
-                    for entry_dir in feed_dir.iterdir():
-                        logger.debug(f"  Checking entry directory: {entry_dir}")
-                        if entry_dir.is_dir():
-                            try:
-                                # Get the modification time of the entry directory
-                                entry_mtime = entry_dir.stat().st_mtime
-                                entry_mtime_dt = datetime.datetime.fromtimestamp(entry_mtime)
-                                is_older = entry_mtime < cutoff_timestamp
-                                logger.debug(f"    Entry mtime: {entry_mtime_dt} ({entry_mtime}) | Older than cutoff? {is_older}")
-                                if is_older:
-                                    logger.info(f"    Attempting to remove old cache directory: {entry_dir}")
-                                    shutil.rmtree(entry_dir)
-                                    logger.debug(f"    Successfully removed old cache directory: {entry_dir}")
-                                    cleaned_count += 1
-                            except FileNotFoundError:
-                                # Directory might have been removed in a previous run or concurrently
-                                logger.warning(f"Cache directory not found during cleanup: {entry_dir}")
-                            except Exception as e:
-                                logger.error(f"Error cleaning cache directory {entry_dir}: {e}", exc_info=True)
+            # os.scandir hands back DirEntry objects whose type and stat
+            # results come from the directory read itself, so the walk does
+            # one pass without a separate stat() per path
+            with os.scandir(self.cache_dir) as it:
+                feed_dirs = [feed_entry for feed_entry in it
+                             if feed_entry.is_dir(follow_symlinks=False)]
+            if feed_dirs:
+                # Each feed subtree is independent and the work is all
+                # stat/unlink/rmdir, which releases the GIL, so scanning
+                # them in parallel overlaps the disk latency
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                    cleaned_count = sum(executor.map(
+                        lambda fd: self._clean_feed_dir(fd, cutoff_timestamp),
+                        feed_dirs
+                    ))
         except Exception as e:
             logger.error(f"Error during cache cleanup iteration: {e}", exc_info=True)
         
         if cleaned_count > 0:
+            # Entry directories were removed, so drop any memoized
+            # existence answers and feed indexes
+            with self._mem_lock:
+                self._exists_cache.clear()
+                self._index_cache.clear()
             logger.info(f"Cleaned up {cleaned_count} old cache entries.")
         else:
             logger.info("No old cache entries found to clean.")
\ No newline at end of file
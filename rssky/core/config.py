@@ -8,56 +8,65 @@ validating required settings, and providing access to configuration values.
 import os
 import configparser
 import logging
+import types
 
 logger = logging.getLogger("rssky.config")
 
-class Config:
-    """Configuration manager for RSSky"""
-    
-    DEFAULT_CONFIG = {
-        "API": {
-            "api_url": "https://api.openai.com/v1/chat/completions",
-            "api_key": "",
-            "model": "gpt-4",
-            "temperature": "0.7",
-            "max_tokens": "1000"
-        },
-        "Settings": {
-            "importance_criteria": "Focus on technological breakthroughs, scientific discoveries, major political events, and significant market movements."
-        },
-        "PROMPTS": {
-            "summary_prompt": """
+# Default prompt templates, hoisted to module level so the interpreter
+# builds the large string literals once at import rather than every time
+# the class body's dict is touched
+DEFAULT_SUMMARY_PROMPT = """
             You are an expert news analyst. Analyze the following article and provide:
             1. A 0-10 importance rating (where 10 is extremely important globally)
             2. A max 2000-word summary with one paragraph for each of the news stories in this text
             3. A brief assessment of potential impact
-            4. The date of the article  
+            4. The date of the article
             Base the importance rating on the following user-provided criteria:
             {importance_criteria}
 
-            
+
             Article:
             {article_content}
-            """,
-            
-            "report_prompt": """
+            """
+
+DEFAULT_REPORT_PROMPT = """
             You are an expert news analyst. Below you will find a JSON structure of news article summaries, with importance ratings. Many of these articles may actually be about the same story.  Some articles contain multiple news stories.
             Your job is to group news stories together (treating them as a single story with multiple sources). News stories with multiple sources should be seen as more important than those with a single source.  Don't clump things together in broad subjects, such as AI, that's too broad.  We're focussed on individual NEWS stories.   For each news story, provide:
-            
+
             1. Your own concise title
             2. The importance rating (derived from the source article importance ratings and your judgement on the overall importance criteria below)
             3. A comprehensive summary (300-500 words)
             4. Date (use the most recent date from sources)
             5. A list of ALL multiple related news article sources from the input list (including name, title, and URL)
-            
+
             Use the following criteria to evaluate importance between:
             {importance_criteria}
             Sort all the final news stories by importance rating, highest first.
-            
-            """,
+
+            """
+
+class Config:
+    """Configuration manager for RSSky"""
+
+    # Read-only view: the defaults are shared class state and must never
+    # be mutated by an instance
+    DEFAULT_CONFIG = types.MappingProxyType({
+        "API": {
+            "api_url": "https://api.openai.com/v1/chat/completions",
+            "api_key": "",
+            "model": "gpt-4",
+            "temperature": "0.7",
+            "max_tokens": "1000"
+        },
+        "Settings": {
+            "importance_criteria": "Focus on technological breakthroughs, scientific discoveries, major political events, and significant market movements."
+        },
+        "PROMPTS": {
+            "summary_prompt": DEFAULT_SUMMARY_PROMPT,
+            "report_prompt": DEFAULT_REPORT_PROMPT,
         }
-    }
-    
+    })
+
     def __init__(self, config_path="config.ini"):
         """Initialize configuration from file"""
         self.config_path = config_path
@@ -75,16 +84,28 @@ class Config:
         
         # Validate configuration
         self._validate_config()
+
+        # Materialize the prompt templates once: the getters are called per
+        # entry during summarization, and configparser interpolation plus
+        # the placeholder substitution are pure overhead after the first call
+        self._importance_criteria = self.get('Settings', 'importance_criteria',
+                                             self.DEFAULT_CONFIG['Settings']['importance_criteria'])
+        self._summary_prompt = self._materialize(
+            self.get('PROMPTS', 'summary_prompt', self.DEFAULT_CONFIG['PROMPTS']['summary_prompt']))
+        self._report_prompt = self._materialize(
+            self.get('PROMPTS', 'report_prompt', self.DEFAULT_CONFIG['PROMPTS']['report_prompt']))
+
+    def _materialize(self, prompt):
+        """Fill the {importance_criteria} placeholder into a prompt template"""
+        # A single literal-token replace suffices: the intermediate
+        # ###...### hop only guarded against str.format, which isn't used
+        return prompt.replace("{importance_criteria}", self._importance_criteria)
     
     def _set_defaults(self):
         """Set default configuration values"""
-        for section, options in self.DEFAULT_CONFIG.items():
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            
-            for option, value in options.items():
-                if not self.config.has_option(section, option):
-                    self.config.set(section, option, value)
+        # Only called on a fresh parser, so a bulk read_dict replaces the
+        # per-option has_section/has_option loop
+        self.config.read_dict(self.DEFAULT_CONFIG)
     
     def _save_config(self):
         """Save configuration to file"""
@@ -132,29 +153,12 @@ class Config:
     
     def get_importance_criteria(self):
         """Get user-defined importance criteria"""
-        return self.get('Settings', 'importance_criteria', 
-                        self.DEFAULT_CONFIG['Settings']['importance_criteria'])
-    
+        return self._importance_criteria
+
     def get_summary_prompt(self):
         """Get the summary prompt template with importance criteria filled in"""
-        prompt = self.get('PROMPTS', 'summary_prompt', 
-                          self.DEFAULT_CONFIG['PROMPTS']['summary_prompt'])
-        
-        # Only replace the {importance_criteria} placeholder
-        # Use a temporary placeholder to avoid conflicts with JSON formatting
-        prompt = prompt.replace("{importance_criteria}", "###IMPORTANCE_CRITERIA###")
-        
-        # Now replace the temporary placeholder with the actual criteria
-        return prompt.replace("###IMPORTANCE_CRITERIA###", self.get_importance_criteria())
-    
+        return self._summary_prompt
+
     def get_report_prompt(self):
         """Get the report prompt template with importance criteria filled in"""
-        prompt = self.get('PROMPTS', 'report_prompt', 
-                         self.DEFAULT_CONFIG['PROMPTS']['report_prompt'])
-        
-        # Only replace the {importance_criteria} placeholder
-        # Use a temporary placeholder to avoid conflicts with JSON formatting
-        prompt = prompt.replace("{importance_criteria}", "###IMPORTANCE_CRITERIA###")
-        
-        # Now replace the temporary placeholder with the actual criteria
-        return prompt.replace("###IMPORTANCE_CRITERIA###", self.get_importance_criteria()) 
\ No newline at end of file
+        return self._report_prompt
\ No newline at end of file
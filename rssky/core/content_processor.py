@@ -7,14 +7,53 @@ and text truncation.
 """
 
 import logging
-import requests
-from bs4 import BeautifulSoup
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+import time
+from functools import cache
 from rssky.utils.helpers import is_youtube_url, clean_html, extract_youtube_id
 from rssky.core.cache_manager import CacheManager
 
 logger = logging.getLogger("rssky.content")
 
+# Plain tag names for cleanup; these go through find_all, no CSS engine
+_UNWANTED_TAGS = ['script', 'style', 'nav', 'footer', 'header']
+
+# Cached placeholder for videos without transcripts; acts as a negative
+# cache so we don't hammer the transcript API on every run, but is
+# re-probed after this long in case captions were added later
+_NO_TRANSCRIPT_MARKER = "[No transcript available]"
+_NO_TRANSCRIPT_RETRY_SECONDS = 30 * 86400
+
+
+@cache
+def _soup_tools():
+    """Import the HTML stack and compile the selectors, once, on first use.
+
+    requests/bs4/soupsieve together cost tens of ms to import; a fully
+    cache-hit run never fetches a page, so the import is deferred until a
+    fetch actually happens. The class-based cleanup and content-div
+    selectors come back precompiled so each page skips the per-call
+    selector parse.
+    """
+    from bs4 import BeautifulSoup
+    import soupsieve
+
+    # Prefer lxml: it parses large pages 5-10x faster than the pure-Python
+    # html.parser and with lower peak memory. Fall back gracefully where
+    # the C extension isn't installed.
+    try:
+        import lxml  # noqa: F401
+        parser = 'lxml'
+    except ImportError:
+        parser = 'html.parser'
+
+    unwanted_css = soupsieve.compile('.sidebar, .comments, .ad, .advertisement')
+    # Only the selectors that genuinely need the CSS engine; plain class
+    # names are matched with soup.find(class_=...) in the caller
+    content_selectors = tuple(soupsieve.compile(s) for s in (
+        '#content', '[itemprop="articleBody"]',
+    ))
+    return BeautifulSoup, parser, unwanted_css, content_selectors
+
 class ContentProcessor:
     """Processes content from feed entries"""
     
@@ -24,6 +63,28 @@ class ContentProcessor:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # The pooled HTTP session is built lazily on the first real fetch
+        # so cache-hit runs never import requests at all
+        self._session = None
+
+    def _get_session(self):
+        """Build the pooled fetch session on first use.
+
+        One session shared by all article fetches: keep-alive reuses
+        connections across entries on the same host, and the pool is sized
+        for the thread fan-out the prefetch phase drives.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
     
     def process_entry(self, entry):
         """Process a feed entry and extract its content"""
@@ -36,7 +97,7 @@ class ContentProcessor:
 
         # Use the new consistent method for entry cache key
         try:
-            entry_id = CacheManager.create_entry_cache_key(entry)
+            entry_id = CacheManager.get_entry_cache_key(entry)
         except Exception as e:
             logger.error(f"Failed to create entry cache key for '{entry.get('title', 'Unknown')}': {e}", exc_info=True)
             return None # Cannot process without entry_id
@@ -44,8 +105,11 @@ class ContentProcessor:
         # Check if content is already cached using the new entry_id
         cached_content = self.cache_manager.get_cached_content(feed_id, entry_id)
         if cached_content:
-            logger.debug(f"Using cached content for entry: {feed_id}/{entry_id}")
-            return cached_content
+            if _NO_TRANSCRIPT_MARKER in cached_content and self._negative_cache_expired(feed_id, entry_id):
+                logger.debug(f"Re-probing transcript for entry: {feed_id}/{entry_id}")
+            else:
+                logger.debug(f"Using cached content for entry: {feed_id}/{entry_id}")
+                return cached_content
         
         # Extract content based on entry type
         content = None
@@ -68,7 +132,20 @@ class ContentProcessor:
                 # Returning content might be better, as it can still be processed
 
         return content
-    
+
+    def _negative_cache_expired(self, feed_id, entry_id):
+        """Check whether a cached no-transcript placeholder is stale.
+
+        The placeholder is a valid negative-cache entry while it is fresh;
+        once it ages past the retry window we treat it as a miss so the
+        video gets one more chance at a transcript.
+        """
+        try:
+            mtime = self.cache_manager.get_content_path(feed_id, entry_id).stat().st_mtime
+        except OSError:
+            return False
+        return time.time() - mtime > _NO_TRANSCRIPT_RETRY_SECONDS
+
     def _process_article_entry(self, entry):
         """Process a regular article entry"""
         # Try to use content from feed first
@@ -115,17 +192,21 @@ class ContentProcessor:
             logger.error(f"Could not extract YouTube ID from URL: {video_url}")
             return f"Title: {entry.get('title', 'YouTube Video')}\n[Could not extract YouTube video ID]"
         
+        # Imported here so runs that never hit a YouTube entry skip the
+        # module entirely; sys.modules makes repeat imports free
+        from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+
         try:
             # Try to get transcript
             transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
             
-            # Format transcript text
-            transcript_text = ""
-            for segment in transcript_list:
-                text = segment.get('text', '').strip()
-                if text:
-                    transcript_text += f"{text}\n"
-            
+            # Format transcript text; a single join is O(n) where repeated
+            # str += on thousands of segments is quadratic
+            stripped = (segment.get('text', '').strip() for segment in transcript_list)
+            transcript_text = "\n".join(text for text in stripped if text)
+            if transcript_text:
+                transcript_text += "\n"
+
             # Add video metadata
             title = entry.get('title', 'YouTube Video')
             content = f"Title: {title}\nURL: {video_url}\n\nTranscript:\n{transcript_text}"
@@ -136,7 +217,7 @@ class ContentProcessor:
         except (NoTranscriptFound, TranscriptsDisabled) as e:
             logger.warning(f"No transcript available for YouTube video: {video_id} - {e}")
             # Get video title and make a simple content representation
-            return f"Title: {entry.get('title', 'YouTube Video')}\nURL: {video_url}\n\n[No transcript available]"
+            return f"Title: {entry.get('title', 'YouTube Video')}\nURL: {video_url}\n\n{_NO_TRANSCRIPT_MARKER}"
             
         except Exception as e:
             logger.error(f"Error fetching YouTube transcript: {e}")
@@ -145,35 +226,49 @@ class ContentProcessor:
     def _fetch_article_content(self, url):
         """Fetch and extract the main content from an article URL"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            
+            response = self._get_session().get(url, timeout=15)
+
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch URL: {url} (Status: {response.status_code})")
                 return ""
-            
-            # Use BeautifulSoup to extract the main content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+
+            BeautifulSoup, html_parser, unwanted_css, content_selectors = _soup_tools()
+
+            # Use BeautifulSoup to extract the main content; pass the raw
+            # bytes so the parser can sniff the declared encoding itself
+            soup = BeautifulSoup(response.content, html_parser)
+
             # Remove unwanted elements
-            for tag in soup.select('script, style, nav, footer, header, .sidebar, .comments, .ad, .advertisement'):
+            for tag in soup.find_all(_UNWANTED_TAGS):
                 tag.decompose()
-            
+            for tag in unwanted_css.select(soup):
+                tag.decompose()
+
             # Try to find the main article content using common patterns
             article_content = None
-            
+
             # Try article tag first
             article = soup.find('article')
             if article:
                 article_content = article
-            
-            # Try common content div patterns
+
+            # Try common content div patterns; a plain class-attribute
+            # lookup skips the CSS engine entirely for the frequent cases
+            if not article_content:
+                for cls in ('content', 'post-content', 'entry-content',
+                            'article-content', 'main-content', 'post',
+                            'article', 'story'):
+                    el = soup.find(class_=cls)
+                    if el:
+                        article_content = el
+                        break
+
+            # Fall back to the selectors that need the CSS engine
             if not article_content:
-                for selector in ['.content', '.post-content', '.entry-content', '.article-content', 
-                                '#content', '.main-content', '.post', '.article', '.story',
-                                '[itemprop="articleBody"]']:
-                    content_div = soup.select_one(selector)
-                    if content_div:
-                        article_content = content_div
+                for selector in content_selectors:
+                    matches = selector.select(soup, limit=1)
+                    if matches:
+                        article_content = matches[0]
                         break
             
             # If still no content, use body as fallback
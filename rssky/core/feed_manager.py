@@ -7,76 +7,153 @@ and filter feed entries by date.
 """
 
 import os
+import hashlib
 import logging
 import datetime
+import pickle
 import xml.etree.ElementTree as ET
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
-import feedparser
 from dateutil import parser as date_parser
 
 from rssky.utils.helpers import safe_filename
 
+# fastfeedparser parses with lxml at C speed, roughly an order of
+# magnitude faster than the pure-Python feedparser; it mirrors the
+# feedparser result shape, so we use it when installed and keep
+# feedparser as the battle-tested fallback
+try:
+    import fastfeedparser
+except ImportError:
+    fastfeedparser = None
+
 logger = logging.getLogger("rssky.feeds")
 
+
+def _parse_feed_bytes(content):
+    """Parse raw feed bytes into a feedparser-shaped result.
+
+    Tries fastfeedparser first; any parse failure falls back to
+    feedparser, which tolerates far more malformed feeds.
+    """
+    if fastfeedparser is not None:
+        try:
+            return fastfeedparser.parse(content)
+        except Exception as e:
+            logger.debug(f"fastfeedparser failed, falling back to feedparser: {e}")
+    import feedparser
+    return feedparser.parse(content)
+
 class FeedManager:
     """Manages RSS feeds for RSSky"""
-    
-    def __init__(self, opml_file, cache_manager):
-        """Initialize with OPML file path and cache manager"""
+
+    # Bump this when the structure of the pickled feed list changes
+    OPML_CACHE_VERSION = 1
+
+    def __init__(self, opml_file, cache_manager, session=None):
+        """Initialize with OPML file path, cache manager and an optional
+        shared requests.Session (one is created if not provided)"""
         self.opml_file = opml_file
         self.cache_manager = cache_manager
         self.user_agent = "RSSky Feed Reader/1.0"
+        # A shared session keeps connections alive across fetches, saving
+        # the TCP+TLS handshake for feeds on the same host
+        self.session = session or requests.Session()
+        self.session.headers.setdefault('User-Agent', self.user_agent)
+        # Size the connection pool for the concurrent fetch fan-out so
+        # threads don't queue on pool slots
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
+    def _opml_cache_path(self):
+        """Get the path of the pickled feed-list cache for this OPML file"""
+        path_hash = hashlib.sha1(os.path.abspath(self.opml_file).encode()).hexdigest()[:8]
+        return self.cache_manager.cache_dir / f"opml_{path_hash}.pkl"
+
     def load_feeds(self):
         """Load feeds from OPML file"""
         if not os.path.exists(self.opml_file):
             logger.error(f"OPML file not found: {self.opml_file}")
             return []
-        
+
+        # Subscriptions change rarely, so reuse the parsed feed list from a
+        # previous run as long as the OPML file is unmodified
+        opml_mtime = os.stat(self.opml_file).st_mtime
+        cache_path = self._opml_cache_path()
+        try:
+            if cache_path.exists():
+                with open(cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get('version') == self.OPML_CACHE_VERSION and cached.get('mtime') == opml_mtime:
+                    feeds = cached['feeds']
+                    logger.info(f"Loaded {len(feeds)} feeds from OPML cache")
+                    return feeds
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable OPML cache {cache_path}: {e}")
+
         try:
-            # Parse the OPML file
-            tree = ET.parse(self.opml_file)
-            root = tree.getroot()
-            
-            # Find all outline elements with xmlUrl attribute
+            # Stream the OPML instead of building the whole DOM: iterparse
+            # with an explicit category stack replaces the recursive walk
+            # and frees each element as soon as it's consumed, so even very
+            # large subscription lists parse in O(1) memory. lxml does the
+            # parsing in C when installed; the stdlib parser is the fallback.
+            try:
+                from lxml import etree as iterparse_etree
+            except ImportError:
+                iterparse_etree = ET
+
             feeds = []
-            
-            # Process outlines recursively
-            def process_outline(outline, category=None):
-                # Check if this is a feed
-                xml_url = outline.get('xmlUrl')
-                if xml_url:
-                    feed = {
-                        'url': xml_url,
-                        'title': outline.get('title') or outline.get('text', 'Untitled Feed'),
-                        'html_url': outline.get('htmlUrl', ''),
-                        'category': category
-                    }
-                    feeds.append(feed)
-                
-                # If this is a category (no xmlUrl), process its children
-                elif outline.get('text'):
-                    cat_name = outline.get('text')
-                    for child in outline:
-                        process_outline(child, cat_name)
-            
-            # Start processing from the body element
-            body = root.find('body')
-            if body is not None:
-                for outline in body:
-                    process_outline(outline)
-            
+            category_stack = []
+            for event, elem in iterparse_etree.iterparse(self.opml_file, events=('start', 'end')):
+                if elem.tag != 'outline':
+                    continue
+                xml_url = elem.get('xmlUrl')
+                if event == 'start':
+                    if xml_url:
+                        feeds.append({
+                            'url': xml_url,
+                            'title': elem.get('title') or elem.get('text', 'Untitled Feed'),
+                            'html_url': elem.get('htmlUrl', ''),
+                            'category': category_stack[-1] if category_stack else None
+                        })
+                    else:
+                        # A folder: its text names the category for nested feeds
+                        category_stack.append(elem.get('text'))
+                else:
+                    if not xml_url and category_stack:
+                        category_stack.pop()
+                    elem.clear()
+
             logger.info(f"Loaded {len(feeds)} feeds from OPML")
+
+            # Cache the parsed list keyed on the OPML file's mtime
+            try:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump({
+                        'version': self.OPML_CACHE_VERSION,
+                        'mtime': opml_mtime,
+                        'feeds': feeds,
+                    }, f)
+            except Exception as e:
+                logger.warning(f"Could not write OPML cache {cache_path}: {e}")
+
             return feeds
-            
+
         except Exception as e:
             logger.error(f"Error parsing OPML file: {e}")
             return []
     
     def get_feed_entries(self, feed, since_date=None):
-        """Get entries from a feed, optionally filtered by date"""
+        """Get entries from a feed, optionally filtered by date.
+
+        When since_date is given, every returned entry is guaranteed to have
+        a 'parsed_date' on or after it, so callers don't need to re-check.
+        """
         feed_url = feed['url']
         feed_title = feed.get('title', 'Untitled Feed')
         feed_id = self.cache_manager.generate_feed_id(feed_url, feed_title)
@@ -85,10 +162,28 @@ class FeedManager:
         cached_feed = self.cache_manager.get_cached_feed(feed_id)
         
         if not cached_feed:
+            # An expired cache still carries the server's validators; a
+            # conditional GET lets unchanged feeds answer 304 with no body
+            stale_feed = self.cache_manager.get_cached_feed(feed_id, max_age_hours=None)
+
             # Fetch and parse the feed
             try:
                 logger.info(f"Fetching feed: {feed['title']} ({feed_url})")
-                feed_data = self._fetch_feed(feed_url)
+                feed_data = self._fetch_feed(
+                    feed_url,
+                    etag=stale_feed.get('etag') if stale_feed else None,
+                    last_modified=stale_feed.get('modified') if stale_feed else None,
+                )
+                if feed_data is None:
+                    # 304 Not Modified: re-cache the stale data to refresh
+                    # its timestamp and keep using it
+                    logger.info(f"Feed not modified: {feed['title']}")
+                    feed_data = {
+                        'feed': {'title': stale_feed.get('feed_title', feed_title)},
+                        'entries': stale_feed.get('entries', []),
+                        'etag': stale_feed.get('etag'),
+                        'modified': stale_feed.get('modified'),
+                    }
                 cached_feed = self.cache_manager.cache_feed(feed_id, feed_data)
             except Exception as e:
                 logger.error(f"Error fetching feed {feed_url}: {e}")
@@ -97,45 +192,81 @@ class FeedManager:
         # Process the entries
         entries = cached_feed.get('entries', [])
         filtered_entries = []
-        
+
+        # The metadata is identical for every entry in the feed, so
+        # resolve it once instead of five dict lookups per entry
+        feed_title_value = feed['title']
+        feed_link = feed['html_url']
+        category = feed.get('category', '')
+
         for entry in entries:
-            # Add feed metadata to the entry
-            entry['feed_title'] = feed['title']
+            # Filter on the date first; entries outside the window are
+            # dropped before any metadata is attached, so a mostly-stale
+            # feed costs little more than its date parses
+            entry_date = self._parse_entry_date(entry)
+            if since_date and entry_date and entry_date.date() < since_date:
+                continue
+
+            # Add feed metadata to the surviving entry
+            entry['feed_title'] = feed_title_value
             entry['feed_url'] = feed_url
-            entry['feed_link'] = feed['html_url']
+            entry['feed_link'] = feed_link
             entry['feed_id'] = feed_id
-            entry['category'] = feed.get('category', '')
-            
-            # Process entry date
-            entry_date = self._parse_entry_date(entry)
+            entry['category'] = category
             entry['parsed_date'] = entry_date
-            
-            # Filter by date if needed
-            if since_date and entry_date:
-                if entry_date.date() < since_date:
-                    continue
-            
+
             filtered_entries.append(entry)
         
         logger.info(f"Got {len(filtered_entries)} entries from feed: {feed['title']}")
         return filtered_entries
     
-    def _fetch_feed(self, feed_url):
-        """Fetch and parse an RSS feed"""
-        # Configure feedparser to follow redirects and use our user agent
-        headers = {'User-Agent': self.user_agent}
-        
-        # First make a HEAD request to check for redirects
-        try:
-            response = requests.head(feed_url, headers=headers, allow_redirects=True, timeout=10)
-            if response.status_code == 200 and response.url != feed_url:
-                logger.info(f"Feed URL redirected: {feed_url} -> {response.url}")
-                feed_url = response.url
-        except Exception as e:
-            logger.warning(f"Error checking feed redirects, continuing with original URL: {e}")
-        
-        # Parse the feed
-        feed_data = feedparser.parse(feed_url, agent=self.user_agent)
+    def fetch_many(self, feeds, since_date=None, max_workers=32):
+        """Fetch entries for many feeds concurrently.
+
+        The work is network-bound, so threads overlap the HTTP round
+        trips: wall time approaches the slowest feed instead of the sum
+        of all of them. Returns a list of (feed, entries) pairs in the
+        input order; a feed that fails yields an empty entry list, as
+        get_feed_entries already swallows per-feed errors.
+        """
+        if not feeds:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(feeds))) as executor:
+            return list(executor.map(
+                lambda feed: (feed, self.get_feed_entries(feed, since_date=since_date)),
+                feeds
+            ))
+
+    def _fetch_feed(self, feed_url, etag=None, last_modified=None):
+        """Fetch and parse an RSS feed.
+
+        When validators from a previous fetch are supplied, the GET is
+        conditional; a 304 response returns None so the caller can keep
+        its cached copy without re-downloading or re-parsing the body.
+        """
+        # Fetch the feed body ourselves and hand the bytes to feedparser,
+        # rather than letting feedparser manage the URL fetch; this gives us
+        # explicit timeouts and keeps the slow network I/O under our control
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(feed_url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        # The GET follows redirects itself, so a separate HEAD preflight
+        # would only double the round trips; just log where we ended up
+        if response.url != feed_url:
+            logger.info(f"Feed URL redirected: {feed_url} -> {response.url}")
+        feed_data = _parse_feed_bytes(response.content)
+
+        # Carry the validators along (feedparser's own field names) so the
+        # cache can replay them on the next conditional fetch
+        feed_data['etag'] = response.headers.get('ETag')
+        feed_data['modified'] = response.headers.get('Last-Modified')
         
         # Check for errors
         if feed_data.get('bozo', 0) == 1:
@@ -151,27 +282,42 @@ class FeedManager:
         return feed_data
     
     def _parse_entry_date(self, entry):
-        """Extract and parse the publication date from an entry"""
-        # Try various date fields
-        date_fields = ['published', 'updated', 'pubDate', 'date']
-        
-        for field in date_fields:
-            if field in entry and entry[field]:
+        """Extract and parse the publication date from an entry.
+
+        Almost every entry date is either a struct_time the feed parser
+        already normalized, an RFC 822 string, or ISO 8601; each of those
+        has a cheap C-level parser, so dateutil's token-by-token parse is
+        kept only as the last resort for the odd exotic format.
+        """
+        # The parser-populated struct_time is already normalized (it
+        # round-trips through the JSON cache as a plain list)
+        for field in ('published_parsed', 'updated_parsed'):
+            parsed = entry.get(field)
+            if isinstance(parsed, (tuple, list)) and len(parsed) >= 6:
                 try:
-                    return date_parser.parse(entry[field])
+                    return datetime.datetime(*parsed[:6])
                 except (ValueError, TypeError):
                     pass
-        
-        # If no valid date found, look in extension elements
-        for field_name in entry:
-            if field_name.endswith('_parsed') and field_name.startswith(('published', 'updated')):
-                if isinstance(entry[field_name], tuple) and len(entry[field_name]) >= 9:
-                    # Handle feedparser's time_struct format
-                    try:
-                        return datetime.datetime(*entry[field_name][:6])
-                    except (ValueError, TypeError):
-                        pass
-        
+
+        for field in ('published', 'updated', 'pubDate', 'date'):
+            date_str = entry.get(field)
+            if not date_str:
+                continue
+            # RFC 822 ("Tue, 10 Jun 2025 09:00:00 GMT") dominates RSS
+            try:
+                return parsedate_to_datetime(date_str)
+            except (ValueError, TypeError):
+                pass
+            # ISO 8601 is what Atom feeds use
+            try:
+                return datetime.datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            except (ValueError, TypeError):
+                pass
+            try:
+                return date_parser.parse(date_str)
+            except (ValueError, TypeError):
+                pass
+
         # Fallback to current date
         logger.warning(f"Could not parse date for entry: {entry.get('title', 'Unknown title')}")
-        return datetime.datetime.now() 
\ No newline at end of file
+        return datetime.datetime.now()
\ No newline at end of file
@@ -9,11 +9,320 @@ an index.html file linking to all reports.
 import os
 import logging
 import datetime
+import re
+import string
 from pathlib import Path
 import json
 
 logger = logging.getLogger("rssky.report")
 
+# Report filenames encode their date as YYYYMMDD; formatting one is just
+# a month-name lookup, no strptime or date object needed
+_YYYYMMDD_RE = re.compile(r'\d{8}')
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+# markupsafe escapes in C when installed; the stdlib fallback is still a
+# single C-level str.translate pass
+try:
+    from markupsafe import escape as _escape_html
+except ImportError:
+    from html import escape as _stdlib_escape
+
+    def _escape_html(value):
+        return _stdlib_escape(str(value))
+
+# Static page chrome, built once at import. The generators assemble pages
+# as a list of parts joined at the end; repeated `html += ...` reallocates
+# the whole string every time, which goes quadratic on large digests.
+_REPORT_CSS = """
+    :root {
+        --primary: #1e3a8a;
+        --secondary: #5b21b6;
+        --background: #f9fafb;
+        --text: #111827;
+        --card-bg: #fff;
+        --card-border: #e5e7eb;
+    }
+    body {
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Oxygen, Ubuntu, Cantarell, "Open Sans", "Helvetica Neue", sans-serif;
+        background-color: var(--background);
+        color: var(--text);
+        margin: 0;
+        padding: 20px;
+    }
+    main {
+        max-width: 1000px;
+        margin: 0 auto;
+        padding: 20px;
+    }
+    header {
+        margin-bottom: 30px;
+    }
+    h1 {
+        color: var(--primary);
+        margin-bottom: 5px;
+    }
+    h2 {
+        color: var(--secondary);
+        border-bottom: 2px solid var(--secondary);
+        padding-bottom: 10px;
+        margin-top: 30px;
+    }
+    .date {
+        font-size: 1.2em;
+        color: var(--secondary);
+        margin-bottom: 10px;
+    }
+    .story-card {
+        background-color: var(--card-bg);
+        border: 1px solid var(--card-border);
+        border-radius: 8px;
+        box-shadow: 0 2px 8px rgba(30,58,138,0.03);
+        padding: 24px 28px;
+        margin-bottom: 30px;
+        transition: box-shadow 0.2s;
+    }
+    .story-card:hover {
+        box-shadow: 0 4px 16px rgba(30,58,138,0.08);
+    }
+    .story-meta {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 18px;
+        align-items: center;
+        margin-bottom: 12px;
+    }
+    .importance {
+        color: #fff;
+        background: linear-gradient(90deg, var(--primary), var(--secondary));
+        border-radius: 4px;
+        padding: 4px 12px;
+        font-weight: bold;
+        font-size: 1em;
+        margin-right: 12px;
+    }
+    .sources h4 {
+        margin-top: 0;
+        margin-bottom: 10px;
+    }
+    .source-list {
+        list-style-type: none;
+        padding: 0;
+        margin: 0;
+    }
+    .source-list li {
+        margin-bottom: 8px;
+    }
+    .source-list a {
+        color: var(--secondary);
+        text-decoration: none;
+    }
+    .source-list a:hover {
+        text-decoration: underline;
+    }
+    .no-stories {
+        background-color: var(--card-bg);
+        border-radius: 8px;
+        padding: 20px;
+        text-align: center;
+        color: #666;
+    }
+    footer {
+        margin-top: 50px;
+        text-align: center;
+        font-size: 0.9em;
+        color: #666;
+        border-top: 1px solid var(--card-border);
+        padding-top: 20px;
+    }
+    a {
+        color: var(--secondary);
+        text-decoration: none;
+    }
+    a:hover {
+        text-decoration: underline;
+    }
+    @media (max-width: 768px) {
+        body {
+            padding: 15px;
+        }
+        .story-meta {
+            flex-direction: column;
+        }
+    }
+"""
+
+_REPORT_HEAD_FMT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>RSSky Digest - {date}</title>
+<style>{css}</style>
+</head>
+<body>
+<header>
+    <h1>RSSky Digest</h1>
+    <div class="date">{date}</div>
+    <a href="index.html">← Back to Index</a>
+</header>
+<main>
+<section>
+    <h2>Stories</h2>
+"""
+
+_NO_STORIES = """
+    <div class="no-stories">
+        <p>No stories for today.</p>
+    </div>
+"""
+
+_REPORT_FOOTER_FMT = """
+</section>
+</main>
+<footer>
+    <p>Generated by RSSky on {generated_at}</p>
+</footer>
+</body>
+</html>"""
+
+_STORY_CARD_TPL = string.Template("""
+    <div class="story-card">
+        <h2 class="story-title">$title</h2>
+        <div class="story-meta" style="justify-content: space-between;">
+            $source<div class="importance" style="margin-left:auto;">Importance: $importance/10</div>
+        </div>
+        <div class="summary">
+            $summary
+        </div>
+$sources    </div>
+""")
+
+_SOURCE_ITEM_TPL = string.Template(
+    '            <li><strong>$name</strong>: <a href="$url" target="_blank">$title</a></li>\n')
+
+_INDEX_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>RSSky Digest Index</title>
+    <style>
+        :root {
+            --primary: #1e3a8a;
+            --secondary: #5b21b6;
+            --background: #f9fafb;
+            --text: #111827;
+            --card-bg: #fff;
+            --card-border: #e5e7eb;
+        }
+
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Oxygen, Ubuntu, Cantarell, "Open Sans", "Helvetica Neue", sans-serif;
+            line-height: 1.6;
+            color: var(--text);
+            background-color: var(--background);
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+
+        header {
+            margin-bottom: 40px;
+            text-align: center;
+        }
+
+        h1 {
+            color: var(--primary);
+            margin-bottom: 10px;
+        }
+
+        .description {
+            font-size: 1.1em;
+            color: #666;
+        }
+
+        .reports-list {
+            list-style-type: none;
+            padding: 0;
+        }
+
+        .report-card {
+            background-color: var(--card-bg);
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+            margin-bottom: 15px;
+            padding: 15px 20px;
+            border: 1px solid var(--card-border);
+            transition: transform 0.2s, box-shadow 0.2s;
+        }
+
+        .report-card:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
+        }
+
+        .report-card a {
+            color: var(--secondary);
+            text-decoration: none;
+            font-size: 1.2em;
+            font-weight: 500;
+            display: block;
+        }
+
+        .report-card a:hover {
+            text-decoration: underline;
+        }
+
+        .no-reports {
+            background-color: var(--card-bg);
+            border-radius: 8px;
+            padding: 20px;
+            text-align: center;
+            color: #666;
+        }
+
+        footer {
+            margin-top: 50px;
+            text-align: center;
+            font-size: 0.9em;
+            color: #666;
+            border-top: 1px solid var(--card-border);
+            padding-top: 20px;
+        }
+    </style>
+</head>
+<body>
+    <header>
+        <h1>RSSky Digest Index</h1>
+        <div class="description">Archive of all RSSky daily news digests</div>
+    </header>
+
+    <main>
+"""
+
+_INDEX_ITEM_TPL = string.Template("""
+            <li class="report-card">
+                <a href="$filename">$formatted_date</a>
+            </li>
+""")
+
+_NO_REPORTS = """
+        <div class="no-reports">
+            <p>No reports available yet.</p>
+        </div>
+"""
+
+_INDEX_FOOTER_FMT = """
+    </main>
+
+    <footer>
+        <p>Generated by RSSky on {generated_at}</p>
+    </footer>
+</body>
+</html>"""
+
 class ReportGenerator:
     """Generates HTML reports from digest data"""
     
@@ -21,6 +330,13 @@ class ReportGenerator:
         """Initialize with output directory"""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # One timestamp per run; the footer doesn't need sub-second
+        # accuracy and the index rebuild would otherwise re-format it
+        self._generated_at = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Sidecar listing every report, so rebuilding the index doesn't
+        # re-scan and re-parse the whole archive on each run
+        self._index_cache_path = self.output_dir / ".reports.json"
+        self._reports = None
     
     def create_daily_report(self, digest, date_str, prompt=None, response=None):
         """Create a daily HTML report from digest data. Optionally saves prompt/response in debug dir."""
@@ -44,58 +360,101 @@ class ReportGenerator:
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         logger.info(f"Generated report: {report_path}")
+
+        # Record the new report in the index sidecar
+        formatted_date = self._format_report_date(date_str)
+        if formatted_date:
+            reports = self._load_reports()
+            reports[date_str] = {
+                "filename": report_path.name,
+                "date_str": date_str,
+                "formatted_date": formatted_date,
+            }
+            self._save_reports()
+
         return report_path
-    
+
+    @staticmethod
+    def _format_report_date(date_str):
+        """Format a YYYYMMDD string as e.g. 'June 10, 2025'.
+
+        Returns None for strings that aren't a plausible date, so callers
+        branch on the result instead of catching exceptions.
+        """
+        if not _YYYYMMDD_RE.fullmatch(date_str):
+            return None
+        month = int(date_str[4:6])
+        if not 1 <= month <= 12:
+            return None
+        return f"{_MONTHS[month - 1]} {int(date_str[6:8]):02d}, {date_str[:4]}"
+
+    def _load_reports(self):
+        """Load the report list, migrating from a directory scan once.
+
+        Returns a dict keyed by YYYYMMDD date string. After the first run
+        the sidecar makes this O(1) per day instead of globbing and
+        re-parsing the whole archive.
+        """
+        if self._reports is not None:
+            return self._reports
+
+        try:
+            self._reports = json.loads(self._index_cache_path.read_text(encoding='utf-8'))
+            return self._reports
+        except (OSError, ValueError):
+            pass
+
+        # One-time migration: build the list from the files on disk.
+        # Raw scandir works on plain names, skipping the per-entry Path
+        # construction and stat calls Path.glob would do
+        self._reports = {}
+        with os.scandir(self.output_dir) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                if not name.endswith('.html') or name == 'index.html' or not dir_entry.is_file():
+                    continue
+                date_str = name[:-5]
+                formatted_date = self._format_report_date(date_str)
+                if not formatted_date:
+                    # Skip files with invalid date format
+                    continue
+                self._reports[date_str] = {
+                    "filename": name,
+                    "date_str": date_str,
+                    "formatted_date": formatted_date,
+                }
+        return self._reports
+
+    def _save_reports(self):
+        """Persist the report list sidecar"""
+        try:
+            self._index_cache_path.write_text(
+                json.dumps(self._reports, indent=2), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not write report index cache: {e}")
+
     def update_index(self):
         """Update the index.html file linking to all reports"""
         index_path = self.output_dir / "index.html"
-        
-        # Find all report files
-        report_files = sorted(self.output_dir.glob("*.html"), reverse=True)
-        reports = []
-        
-        for file_path in report_files:
-            if file_path.name != "index.html":
-                # Parse date from filename
-                date_str = file_path.stem
-                if len(date_str) == 8:  # YYYYMMDD format
-                    try:
-                        year = int(date_str[:4])
-                        month = int(date_str[4:6])
-                        day = int(date_str[6:8])
-                        date_obj = datetime.date(year, month, day)
-                        formatted_date = date_obj.strftime("%B %d, %Y")
-                        
-                        reports.append({
-                            "filename": file_path.name,
-                            "date_str": date_str,
-                            "formatted_date": formatted_date
-                        })
-                    except ValueError:
-                        # Skip files with invalid date format
-                        continue
-        
+
+        # Newest first, straight from the cached list
+        reports_by_date = self._load_reports()
+        reports = [reports_by_date[date_str] for date_str in sorted(reports_by_date, reverse=True)]
+
         # Generate index HTML
         html_content = self._generate_index_html(reports)
-        
+
         # Write to file
         with open(index_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
-        
+
         logger.info(f"Updated index: {index_path}")
         return index_path
     
     def _generate_html_report(self, digest, date_str):
         """Generate HTML content for a daily report"""
         # Parse date
-        try:
-            year = int(date_str[:4])
-            month = int(date_str[4:6])
-            day = int(date_str[6:8])
-            date_obj = datetime.date(year, month, day)
-            formatted_date = date_obj.strftime("%B %d, %Y")
-        except ValueError:
-            formatted_date = date_str
+        formatted_date = self._format_report_date(date_str) or date_str
         
         # Get the stories list (new format)
         stories = digest.get('stories', [])
@@ -113,159 +472,13 @@ class ReportGenerator:
                 return story.get('importance_rating', story.get('importance', 0))
             stories.sort(key=get_importance, reverse=True)
         
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>RSSky Digest - {formatted_date}</title>
-        <style>
-            :root {{
-                --primary: #1e3a8a;
-                --secondary: #5b21b6;
-                --background: #f9fafb;
-                --text: #111827;
-                --card-bg: #fff;
-                --card-border: #e5e7eb;
-            }}
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Oxygen, Ubuntu, Cantarell, "Open Sans", "Helvetica Neue", sans-serif;
-                background-color: var(--background);
-                color: var(--text);
-                margin: 0;
-                padding: 20px;
-            }}
-            main {{
-                max-width: 1000px;
-                margin: 0 auto;
-                padding: 20px;
-            }}
-            header {{
-                margin-bottom: 30px;
-            }}
-            h1 {{
-                color: var(--primary);
-                margin-bottom: 5px;
-            }}
-            h2 {{
-                color: var(--secondary);
-                border-bottom: 2px solid var(--secondary);
-                padding-bottom: 10px;
-                margin-top: 30px;
-            }}
-            .date {{
-                font-size: 1.2em;
-                color: var(--secondary);
-                margin-bottom: 10px;
-            }}
-            .story-card {{
-                background-color: var(--card-bg);
-                border: 1px solid var(--card-border);
-                border-radius: 8px;
-                box-shadow: 0 2px 8px rgba(30,58,138,0.03);
-                padding: 24px 28px;
-                margin-bottom: 30px;
-                transition: box-shadow 0.2s;
-            }}
-            .story-card:hover {{
-                box-shadow: 0 4px 16px rgba(30,58,138,0.08);
-            }}
-            .story-meta {{
-                display: flex;
-                flex-wrap: wrap;
-                gap: 18px;
-                align-items: center;
-                margin-bottom: 12px;
-            }}
-            .importance {{
-                color: #fff;
-                background: linear-gradient(90deg, var(--primary), var(--secondary));
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-weight: bold;
-                font-size: 1em;
-                margin-right: 12px;
-            }}
-            .sources h4 {{
-                margin-top: 0;
-                margin-bottom: 10px;
-            }}
-            .source-list {{
-                list-style-type: none;
-                padding: 0;
-                margin: 0;
-            }}
-            .source-list li {{
-                margin-bottom: 8px;
-            }}
-            .source-list a {{
-                color: var(--secondary);
-                text-decoration: none;
-            }}
-            .source-list a:hover {{
-                text-decoration: underline;
-            }}
-            .no-stories {{
-                background-color: var(--card-bg);
-                border-radius: 8px;
-                padding: 20px;
-                text-align: center;
-                color: #666;
-            }}
-            footer {{
-                margin-top: 50px;
-                text-align: center;
-                font-size: 0.9em;
-                color: #666;
-                border-top: 1px solid var(--card-border);
-                padding-top: 20px;
-            }}
-            a {{
-                color: var(--secondary);
-                text-decoration: none;
-            }}
-            a:hover {{
-                text-decoration: underline;
-            }}
-            @media (max-width: 768px) {{
-                body {{
-                    padding: 15px;
-                }}
-                .story-meta {{
-                    flex-direction: column;
-                }}
-            }}
-        </style>
-        </head>
-        <body>
-        <header>
-            <h1>RSSky Digest</h1>
-            <div class="date">{formatted_date}</div>
-            <a href="index.html">← Back to Index</a>
-        </header>
-        <main>
-        <section>
-            <h2>Stories</h2>
-        """
+        parts = [_REPORT_HEAD_FMT.format(date=_escape_html(formatted_date), css=_REPORT_CSS)]
         if stories:
-            for story in stories:
-                html += self._generate_story_card(story)
+            parts.extend(self._generate_story_card(story) for story in stories)
         else:
-            html += """
-            <div class="no-stories">
-                <p>No stories for today.</p>
-            </div>
-            """
-        html += """
-        </section>
-        </main>
-        <footer>
-            <p>Generated by RSSky on """ + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """</p>
-        </footer>
-        </body>
-        </html>"""
-        return html
+            parts.append(_NO_STORIES)
+        parts.append(_REPORT_FOOTER_FMT.format(generated_at=self._generated_at))
+        return "".join(parts)
     
     def _generate_story_card(self, story):
         """Generate HTML for a story card"""
@@ -293,192 +506,65 @@ class ReportGenerator:
         # Get impact if available
         impact = story.get('impact', '')
         
-        # Combine summary and impact if both exist
-        full_summary = summary_text
+        # Combine summary and impact if both exist; both quote article
+        # text verbatim, so escape them — the Impact wrapper markup is
+        # built here, not by the model
+        full_summary = _escape_html(summary_text)
         if impact and impact != 'No impact assessment available':
-            full_summary += f"<p><strong>Impact:</strong> {impact}</p>"
+            full_summary += f"<p><strong>Impact:</strong> {_escape_html(impact)}</p>"
         
         # Check if we have the old format with sources
         sources = story.get('sources', [])
         
         # Remove 'Source: Unknown Source' if sources are present, and only show Source if not redundant
         show_source = not sources and feed and feed != 'Unknown Source'
-        html = f"""
-            <div class="story-card">
-                <h2 class="story-title">{title}</h2>
-                <div class="story-meta" style="justify-content: space-between;">
-        """
-        if show_source:
-            html += f"<div>Source: {feed}</div>"
-        html += f"<div class=\"importance\" style=\"margin-left:auto;\">Importance: {importance_display}/10</div>"
-        html += f"""
-                </div>
-                <div class="summary">
-                    {full_summary}
-                </div>
-        """
-        # Add sources section if we have sources
+
+        # Build the sources block with a join rather than repeated +=
+        sources_html = ""
         if sources:
-            html += """
-                <div class="sources">
-                    <h4>Sources:</h4>
-                    <ul class="source-list">
-            """
-            
-            for source in sources:
-                name = source.get('name', 'Unknown')
-                src_title = source.get('title', 'Untitled')
-                src_url = source.get('url', '#')
-                
-                html += f"""
-                        <li><strong>{name}</strong>: <a href="{src_url}" target="_blank">{src_title}</a></li>
-                """
-            
-            html += """
-                    </ul>
-                </div>
-            """
-        
-        html += """
-            </div>
-        """
-        
-        return html
+            items = "".join(
+                _SOURCE_ITEM_TPL.substitute(
+                    name=_escape_html(source.get('name', 'Unknown')),
+                    title=_escape_html(source.get('title', 'Untitled')),
+                    url=_escape_html(source.get('url', '#')),
+                )
+                for source in sources
+            )
+            sources_html = (
+                '        <div class="sources">\n'
+                '            <h4>Sources:</h4>\n'
+                '            <ul class="source-list">\n'
+                f'{items}'
+                '            </ul>\n'
+                '        </div>\n'
+            )
+
+        # full_summary's content is already escaped above; only the
+        # code-built Impact wrapper markup survives as HTML
+        return _STORY_CARD_TPL.substitute(
+            title=_escape_html(title),
+            source=f"<div>Source: {_escape_html(feed)}</div>" if show_source else "",
+            importance=importance_display,
+            summary=full_summary,
+            sources=sources_html,
+        )
     
     def _generate_index_html(self, reports):
         """Generate HTML for the index page"""
-        html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>RSSky Digest Index</title>
-    <style>
-        :root {
-            --primary: #1e3a8a;
-            --secondary: #5b21b6;
-            --background: #f9fafb;
-            --text: #111827;
-            --card-bg: #fff;
-            --card-border: #e5e7eb;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Oxygen, Ubuntu, Cantarell, "Open Sans", "Helvetica Neue", sans-serif;
-            line-height: 1.6;
-            color: var(--text);
-            background-color: var(--background);
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        header {
-            margin-bottom: 40px;
-            text-align: center;
-        }
-        
-        h1 {
-            color: var(--primary);
-            margin-bottom: 10px;
-        }
-        
-        .description {
-            font-size: 1.1em;
-            color: #666;
-        }
-        
-        .reports-list {
-            list-style-type: none;
-            padding: 0;
-        }
-        
-        .report-card {
-            background-color: var(--card-bg);
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-            margin-bottom: 15px;
-            padding: 15px 20px;
-            border: 1px solid var(--card-border);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-        
-        .report-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-        }
-        
-        .report-card a {
-            color: var(--secondary);
-            text-decoration: none;
-            font-size: 1.2em;
-            font-weight: 500;
-            display: block;
-        }
-        
-        .report-card a:hover {
-            text-decoration: underline;
-        }
-        
-        .no-reports {
-            background-color: var(--card-bg);
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-            color: #666;
-        }
-        
-        footer {
-            margin-top: 50px;
-            text-align: center;
-            font-size: 0.9em;
-            color: #666;
-            border-top: 1px solid var(--card-border);
-            padding-top: 20px;
-        }
-    </style>
-</head>
-<body>
-    <header>
-        <h1>RSSky Digest Index</h1>
-        <div class="description">Archive of all RSSky daily news digests</div>
-    </header>
-    
-    <main>
-"""
-        
+        parts = [_INDEX_HEAD]
+
         if reports:
-            html += """
-        <ul class="reports-list">
-"""
-            
-            for report in reports:
-                filename = report["filename"]
-                formatted_date = report["formatted_date"]
-                
-                html += f"""
-            <li class="report-card">
-                <a href="{filename}">{formatted_date}</a>
-            </li>
-"""
-            
-            html += """
-        </ul>
-"""
+            parts.append('        <ul class="reports-list">\n')
+            parts.extend(
+                _INDEX_ITEM_TPL.substitute(
+                    filename=_escape_html(report["filename"]),
+                    formatted_date=_escape_html(report["formatted_date"]),
+                )
+                for report in reports
+            )
+            parts.append('        </ul>\n')
         else:
-            html += """
-        <div class="no-reports">
-            <p>No reports available yet.</p>
-        </div>
-"""
-        
-        html += """
-    </main>
-    
-    <footer>
-        <p>Generated by RSSky on """ + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """</p>
-    </footer>
-</body>
-</html>"""
-        
-        return html 
\ No newline at end of file
+            parts.append(_NO_REPORTS)
+
+        parts.append(_INDEX_FOOTER_FMT.format(generated_at=self._generated_at))
+        return "".join(parts)
\ No newline at end of file
@@ -1,10 +1,25 @@
-import os
-import glob
-import datetime
 import configparser
+import datetime
+import os
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from xml.sax.saxutils import escape
-from feedgen.feed import FeedGenerator
+
+
+@lru_cache(maxsize=4)
+def _load_feed_meta(config_path, mtime):
+    """Read the channel metadata from the config file.
+
+    Keyed on (path, mtime) so repeated feed regenerations in one run skip
+    the disk read and INI tokenization, while edits still take effect.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return (
+        config.get("Feed", "feed_name", fallback="RSSky Daily Digest"),
+        config.get("Feed", "author", fallback="RSSky Bot"),
+        config.get("Feed", "site_url", fallback="http://localhost/"),
+    )
 
 
 def generate_daily_rss_feed(output_dir, config_path, stories_by_date):
@@ -13,45 +28,51 @@ def generate_daily_rss_feed(output_dir, config_path, stories_by_date):
     Each item is a daily digest with a paragraph summary and a link to the HTML file.
     stories_by_date: dict of {date_str: [story, ...]}
     """
-    config = configparser.ConfigParser()
-    config.read(config_path)
-    feed_title = config.get("Feed", "feed_name", fallback="RSSky Daily Digest")
-    feed_author = config.get("Feed", "author", fallback="RSSky Bot")
-    site_url = config.get("Feed", "site_url", fallback="http://localhost/")
+    try:
+        config_mtime = os.path.getmtime(config_path)
+    except OSError:
+        config_mtime = 0
+    feed_title, feed_author, site_url = _load_feed_meta(config_path, config_mtime)
 
-    fg = FeedGenerator()
-    fg.title(feed_title)
-    fg.link(href=site_url, rel="alternate")
-    fg.description(f"{feed_title} - AI-generated summaries of daily news")
-    fg.language('en')
-    fg.author({'name': feed_author})
+    # Build the RSS tree directly with ElementTree (C-accelerated in
+    # CPython); feedgen's per-entry model objects and validation are pure
+    # overhead for a feed this simple, and dropping it removes a dependency
+    rss = ET.Element('rss', version='2.0')
+    channel = ET.SubElement(rss, 'channel')
+    ET.SubElement(channel, 'title').text = feed_title
+    ET.SubElement(channel, 'link').text = site_url
+    ET.SubElement(channel, 'description').text = f"{feed_title} - AI-generated summaries of daily news"
+    ET.SubElement(channel, 'language').text = 'en'
+    ET.SubElement(channel, 'managingEditor').text = feed_author
 
     # Sort by date descending
     for date_str in sorted(stories_by_date.keys(), reverse=True):
         stories = stories_by_date[date_str]
         # Compose a paragraph summary for the day
         if stories:
-            summary_parts = []
+            buf = []
             for s in stories:
-                summary_item = s.get('summary', '')
-                if isinstance(summary_item, list):
-                    summary_parts.append(" ".join(summary_item))
-                else:
-                    summary_parts.append(summary_item)
-            summary = " ".join(summary_parts)
-            summary = summary[:800] + ("..." if len(summary) > 800 else "")
+                item = s.get('summary', '')
+                buf.append(" ".join(item) if isinstance(item, list) else item)
+            summary = " ".join(buf)
+            # Slice only the days that actually exceed the limit
+            if len(summary) > 800:
+                summary = summary[:800] + "..."
         else:
             summary = f"No stories for {date_str}."
         # Compose link to HTML file
         html_file = f"{date_str}.html"
         pub_date = datetime.datetime.strptime(date_str, "%Y%m%d").strftime("%a, %d %b %Y 00:00:00 +0000")
-        fe = fg.add_entry()
-        fe.title(f"Daily Digest for {date_str}")
-        fe.link(href=f"{site_url}output/{html_file}")
-        fe.guid(date_str, permalink=False)
-        fe.pubDate(pub_date)
-        fe.description(summary)
-    # Write RSS file
+
+        item = ET.SubElement(channel, 'item')
+        ET.SubElement(item, 'title').text = f"Daily Digest for {date_str}"
+        ET.SubElement(item, 'link').text = f"{site_url}output/{html_file}"
+        ET.SubElement(item, 'guid', isPermaLink="false").text = date_str
+        ET.SubElement(item, 'pubDate').text = pub_date
+        ET.SubElement(item, 'description').text = summary
+
+    # Write RSS file; the serializer escapes all text content itself
     rss_path = Path(output_dir) / "feed.rss"
-    fg.rss_file(str(rss_path), pretty=True)
+    ET.indent(rss)
+    ET.ElementTree(rss).write(str(rss_path), xml_declaration=True, encoding='utf-8')
     return str(rss_path)
@@ -7,22 +7,62 @@ This module provides utility functions used throughout the application.
 import re
 import unicodedata
 import logging
+from functools import lru_cache
+from html import unescape
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# selectolax strips tags and decodes entities in C, an order of magnitude
+# faster than the pure-Python replace/regex chain below, and handles the
+# full entity set (&#x2F;, named entities) correctly as a byproduct
+try:
+    from selectolax.parser import HTMLParser as _HTMLParser
+except ImportError:
+    _HTMLParser = None
 
 logger = logging.getLogger("rssky.utils")
 
+# Query parameters that only carry click/campaign tracking state and never
+# change which article a URL points at
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'source', 'cmpid'}
+
+# Compiled once at import: these run per entry on hot paths, so skip the
+# re-module cache lookup (and re-parse on cache miss) on every call
+_UNSAFE_CHARS = re.compile(r'[^\w\-\.]')
+_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+_ALREADY_SAFE = re.compile(r'[\w.\-]+')
+_TAG_RE = re.compile(r'<[^>]*>')
+_MULTI_NEWLINE = re.compile(r'\n{3,}')
+_MULTI_SPACE = re.compile(r' {2,}')
+# One alternation per check instead of three separate engine invocations
+_YOUTUBE_URL_RE = re.compile(r'youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/')
+_YOUTUBE_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+
+@lru_cache(maxsize=512)
 def safe_filename(text):
     """
     Convert a string to a safe filename by removing unsafe characters
     and replacing spaces with underscores.
+
+    The same feed and entry titles come through on every run, so results
+    are memoized; the input is a plain string and the output is pure.
     """
+    # Fast path: most feed and entry titles used as filenames are already
+    # clean ASCII, and one C-level fullmatch skips the expensive NFKD
+    # normalization plus two substitutions below
+    if (text and len(text) <= 100 and text.isascii()
+            and _ALREADY_SAFE.fullmatch(text)
+            and '__' not in text
+            and not text.startswith('_') and not text.endswith('_')):
+        return text
+
     # Normalize unicode characters
     text = unicodedata.normalize('NFKD', text)
     
     # Remove non-alphanumeric characters (except underscores, hyphens, and periods)
-    text = re.sub(r'[^\w\-\.]', '_', text)
-    
+    text = _UNSAFE_CHARS.sub('_', text)
+
     # Replace multiple consecutive underscores with a single one
-    text = re.sub(r'_{2,}', '_', text)
+    text = _MULTI_UNDERSCORE.sub('_', text)
     
     # Trim leading/trailing underscores
     text = text.strip('_')
@@ -46,19 +86,16 @@ def truncate_text(text, max_length=15000):
     
     if len(text) <= max_length:
         return text
-    
-    # Find the last space within the limit
-    last_space = text.rfind(' ', 0, max_length)
+
+    # Slice the head once, then search within it; rfind on the full string
+    # with bounds would rescan the same region of a much larger buffer
+    head = text[:max_length]
+    last_space = head.rfind(' ')
     if last_space != -1:
-        truncated = text[:last_space]
-    else:
-        # If no space found, just cut at the limit
-        truncated = text[:max_length]
-    
+        head = head[:last_space]
+
     # Add ellipsis to indicate truncation
-    truncated += "... [text truncated]"
-    
-    return truncated
+    return head + "... [text truncated]"
 
 def clean_html(html_text):
     """
@@ -68,33 +105,67 @@ def clean_html(html_text):
     """
     if not html_text:
         return ""
-    
+
+    if _HTMLParser is not None:
+        # C parser: tags stripped and entities decoded in one pass
+        text = _HTMLParser(html_text).text(separator='\n')
+        text = text.replace('\xa0', ' ')
+        text = _MULTI_NEWLINE.sub('\n\n', text)
+        text = _MULTI_SPACE.sub(' ', text)
+        return text.strip()
+
+    # Pure-Python fallback when selectolax is not installed
+
     # Replace common block elements with newlines
     for tag in ['</p>', '</div>', '</h1>', '</h2>', '</h3>', '</h4>', '</h5>', '</h6>', '</li>', '</tr>']:
         html_text = html_text.replace(tag, tag + '\n\n')
-    
+
     # Replace <br> tags with newlines
     html_text = html_text.replace('<br>', '\n')
     html_text = html_text.replace('<br/>', '\n')
     html_text = html_text.replace('<br />', '\n')
-    
+
     # Remove all HTML tags
-    html_text = re.sub(r'<[^>]*>', '', html_text)
-    
-    # Convert HTML entities
-    html_text = html_text.replace('&nbsp;', ' ')
-    html_text = html_text.replace('&amp;', '&')
-    html_text = html_text.replace('&lt;', '<')
-    html_text = html_text.replace('&gt;', '>')
-    html_text = html_text.replace('&quot;', '"')
-    html_text = html_text.replace('&#39;', "'")
-    
+    html_text = _TAG_RE.sub('', html_text)
+
+    # Convert HTML entities; unescape handles the full named and numeric
+    # entity set, with &nbsp; mapped on to a plain space afterwards
+    html_text = unescape(html_text).replace('\xa0', ' ')
+
     # Normalize whitespace
-    html_text = re.sub(r'\n{3,}', '\n\n', html_text)
-    html_text = re.sub(r' {2,}', ' ', html_text)
-    
+    html_text = _MULTI_NEWLINE.sub('\n\n', html_text)
+    html_text = _MULTI_SPACE.sub(' ', html_text)
+
     return html_text.strip()
 
+def canonical_url(url):
+    """
+    Normalize a URL for duplicate detection: lowercase the scheme and host,
+    drop the fragment, trailing slashes and common tracking query parameters.
+    Returns "" for empty input.
+    """
+    if not url:
+        return ""
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key not in TRACKING_PARAMS
+    ]
+
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        urlencode(query),
+        '',  # drop the fragment
+    ))
+
 def format_date(date_obj, format_str="%Y-%m-%d"):
     """
     Format a datetime object as a string.
@@ -114,18 +185,8 @@ def is_youtube_url(url):
     """
     if not url:
         return False
-    
-    youtube_patterns = [
-        r'(youtube\.com\/watch\?v=)',
-        r'(youtu\.be\/)',
-        r'(youtube\.com\/shorts\/)'
-    ]
-    
-    for pattern in youtube_patterns:
-        if re.search(pattern, url):
-            return True
-    
-    return False
+
+    return _YOUTUBE_URL_RE.search(url) is not None
 
 def extract_youtube_id(url):
     """
@@ -133,20 +194,7 @@ def extract_youtube_id(url):
     """
     if not url:
         return None
-    
-    # Match standard YouTube watch URLs
-    match = re.search(r'youtube\.com\/watch\?v=([a-zA-Z0-9_-]{11})', url)
-    if match:
-        return match.group(1)
-    
-    # Match short YouTube URLs
-    match = re.search(r'youtu\.be\/([a-zA-Z0-9_-]{11})', url)
-    if match:
-        return match.group(1)
-    
-    # Match YouTube Shorts URLs
-    match = re.search(r'youtube\.com\/shorts\/([a-zA-Z0-9_-]{11})', url)
-    if match:
-        return match.group(1)
-    
-    return None 
\ No newline at end of file
+
+    # Watch, short and Shorts URLs in a single alternation
+    match = _YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None 
\ No newline at end of file
@@ -1,29 +1,59 @@
+import io
+import os
 import unittest
 import sys
 
+def _use_color(stream):
+    """Color only interactive terminals, honoring the NO_COLOR convention"""
+    if os.environ.get('NO_COLOR'):
+        return False
+    return getattr(stream, 'isatty', lambda: False)()
+
 class CustomTestResult(unittest.TextTestResult):
     """A custom test result class for colorful output."""
-    
+
     GREEN = '\033[92m'
     RED = '\033[91m'
     RESET = '\033[0m'
-    
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.success_char = f"{self.GREEN}✅{self.RESET}"
-        self.failure_char = f"{self.RED}❌{self.RESET}"
+        # Emitting escape codes into piped CI logs just doubles the bytes
+        # and confuses log collectors; the empty strings interpolate away
+        if _use_color(self.stream):
+            green, red, reset = self.GREEN, self.RED, self.RESET
+        else:
+            green = red = reset = ''
+        self.success_char = f"{green}✅{reset}"
+        self.failure_char = f"{red}❌{reset}"
+        # Result lines go into a buffer and hit the real stream once per
+        # test; small direct writes can each trigger a flush on piped or
+        # Windows consoles. The status suffixes are built once here
+        # instead of per test.
+        self._buf = io.StringIO()
+        self._ok_suffix = f" ... {green}ok{reset}\n"
+        self._fail_suffix = f" ... {red}FAIL{reset}\n"
+        self._error_suffix = f" ... {red}ERROR{reset}\n"
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        buffered = self._buf.getvalue()
+        if buffered:
+            self.stream.write(buffered)
+            self._buf.seek(0)
+            self._buf.truncate()
 
     def addSuccess(self, test):
         super().addSuccess(test)
-        self.stream.writeln(f"{self.success_char} {self.getDescription(test)} ... {self.GREEN}ok{self.RESET}")
+        self._buf.write(f"{self.success_char} {self.getDescription(test)}{self._ok_suffix}")
 
     def addFailure(self, test, err):
         super().addFailure(test, err)
-        self.stream.writeln(f"{self.failure_char} {self.getDescription(test)} ... {self.RED}FAIL{self.RESET}")
+        self._buf.write(f"{self.failure_char} {self.getDescription(test)}{self._fail_suffix}")
 
     def addError(self, test, err):
         super().addError(test, err)
-        self.stream.writeln(f"{self.failure_char} {self.getDescription(test)} ... {self.RED}ERROR{self.RESET}")
+        self._buf.write(f"{self.failure_char} {self.getDescription(test)}{self._error_suffix}")
 
     def printErrors(self):
         self.stream.writeln()
@@ -38,12 +68,17 @@ class CustomTestRunner(unittest.TextTestRunner):
     def run(self, test):
         result = super().run(test)
         self.stream.writeln("-" * 70)
-        
+
+        if _use_color(self.stream):
+            green, red, reset = CustomTestResult.GREEN, CustomTestResult.RED, CustomTestResult.RESET
+        else:
+            green = red = reset = ''
+
         # Custom summary line
         if result.wasSuccessful():
-            summary = f"{CustomTestResult.GREEN}✅ All {result.testsRun} tests passed successfully.{CustomTestResult.RESET}"
+            summary = f"{green}✅ All {result.testsRun} tests passed successfully.{reset}"
         else:
-            summary = f"{CustomTestResult.RED}❌ {len(result.failures) + len(result.errors)} of {result.testsRun} tests failed.{CustomTestResult.RESET}"
-            
+            summary = f"{red}❌ {len(result.failures) + len(result.errors)} of {result.testsRun} tests failed.{reset}"
+
         self.stream.writeln(summary)
         return result
\ No newline at end of file
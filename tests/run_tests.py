@@ -1,24 +1,50 @@
 import unittest
+import subprocess
 import sys
 import os
 
-from custom_test_runner import CustomTestRunner
+try:
+    from custom_test_runner import CustomTestRunner
+except ImportError:
+    from tests.custom_test_runner import CustomTestRunner
 
-def run_tests():
+def _pytest_xdist_available():
+    """Check whether pytest and pytest-xdist are importable"""
+    try:
+        import pytest  # noqa: F401
+        import xdist  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def run_tests(extra_args=None):
     # Add the project root directory to the Python path
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, project_root)
-    
-    # Discover and run tests
+
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Distribute tests across cores when pytest-xdist is installed; the
+    # test cases are independent, so they scale close to linearly.
+    # loadfile keeps each module on one worker, so class-level fixtures
+    # are built once per module. Extra command-line arguments are passed
+    # through to pytest, so e.g. `python run_tests.py --lf` reruns only
+    # the last failures during an edit-test loop
+    if _pytest_xdist_available():
+        result = subprocess.run([sys.executable, "-m", "pytest", "-n", "auto",
+                                 "--dist", "loadfile", tests_dir]
+                                + list(extra_args or []))
+        return result.returncode
+
+    # Fall back to the serial unittest runner
     loader = unittest.TestLoader()
-    start_dir = os.path.dirname(os.path.abspath(__file__))
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
+    suite = loader.discover(tests_dir, pattern='test_*.py')
+
     runner = CustomTestRunner(verbosity=0)
     result = runner.run(suite)
-    
+
     # Return 0 if tests passed, 1 if any failed
     return 0 if result.wasSuccessful() else 1
 
 if __name__ == '__main__':
-    sys.exit(run_tests()) 
\ No newline at end of file
+    sys.exit(run_tests(sys.argv[1:]))
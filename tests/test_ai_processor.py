@@ -1,8 +1,9 @@
 import unittest
-from unittest.mock import patch, MagicMock
-import json
+from unittest.mock import patch, Mock, MagicMock
+import orjson
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
 # Ensure the project root is in the Python path
@@ -16,52 +17,68 @@ from rssky.core.config import Config
 
 class TestAIProcessor(unittest.TestCase):
 
-    def setUp(self):
-        """Set up a test environment."""
-        self.test_cache_dir = Path("./test_cache_ai")
-        self.test_cache_dir.mkdir(exist_ok=True)
-        
-        self.cache_manager = CacheManager(cache_dir=str(self.test_cache_dir))
-        
-        # Create a mock config object
-        self.mock_config = MagicMock(spec=Config)
-        self.mock_config.get_api_config.return_value = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared cache fixture once per class"""
+        # A RAM-backed directory under /dev/shm (when present) keeps the
+        # cache writes out of the disk entirely; the mkdtemp name is
+        # unique, so parallel xdist workers can't collide
+        shm = "/dev/shm"
+        cls._tmp = tempfile.TemporaryDirectory(
+            prefix="rssky_test_cache_ai_", dir=shm if os.path.isdir(shm) else None)
+        cls.test_cache_dir = Path(cls._tmp.name)
+        cls.cache_manager = CacheManager(cache_dir=str(cls.test_cache_dir))
+
+        cls.test_feed_url = "http://test.com/feed"
+        cls.test_feed_title = "Test Feed"
+        cls.test_feed_id = cls.cache_manager.generate_feed_id(cls.test_feed_url, cls.test_feed_title)
+        cls.test_entry = {
+            'title': 'Test Entry',
+            'link': 'http://test.com/entry',
+            'id': '12345',
+            'published': '2023-01-01T12:00:00Z',
+            'feed_title': cls.test_feed_title,
+            'feed_id': cls.test_feed_id
+        }
+        cls.test_entry_id = cls.cache_manager.create_entry_cache_key(cls.test_entry)
+
+        # The spec'd mock walks Config's full attribute set on
+        # construction, and no test mutates its return values, so build
+        # it once for the class
+        cls.mock_config = MagicMock(spec=Config)
+        cls.mock_config.get_api_config.return_value = {
             'api_url': 'https://api.test.com/v1/chat/completions',
             'api_key': 'test_key',
             'model': 'test-model',
             'temperature': 0.5,
             'max_tokens': 1000
         }
-        self.mock_config.get_summary_prompt.return_value = "Summarize: {article_content}"
-        self.mock_config.get_report_prompt.return_value = "Digest: {summaries_json}"
+        cls.mock_config.get_summary_prompt.return_value = "Summarize: {article_content}"
+        cls.mock_config.get_report_prompt.return_value = "Digest: {summaries_json}"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary cache directory after the class is done"""
+        cls._tmp.cleanup()
+        # AIProcessor only writes debug artifacts when debug logging is
+        # enabled, which these tests never turn on; one sweep at the end
+        # covers the rare stale directory without a stat per test
+        debug_dir = Path("debug")
+        if debug_dir.exists():
+            shutil.rmtree(debug_dir)
+
+    def setUp(self):
+        """Set up a test environment."""
+        # Start from an empty cache; the directory, manager and mock
+        # config are shared class fixtures
+        self.cache_manager.clear_all_cache()
 
         self.ai_processor = AIProcessor(config=self.mock_config, cache_manager=self.cache_manager)
 
-        self.test_feed_url = "http://test.com/feed"
-        self.test_feed_title = "Test Feed"
-        self.test_feed_id = self.cache_manager.generate_feed_id(self.test_feed_url, self.test_feed_title)
-        self.test_entry = {
-            'title': 'Test Entry',
-            'link': 'http://test.com/entry',
-            'id': '12345',
-            'published': '2023-01-01T12:00:00Z',
-            'feed_title': self.test_feed_title,
-            'feed_id': self.test_feed_id
-        }
-        self.test_entry_id = self.cache_manager.create_entry_cache_key(self.test_entry)
-        
         # Cache some mock content for the entry
         self.cache_manager.cache_content(self.test_feed_id, self.test_entry_id, "This is the article content.")
 
-    def tearDown(self):
-        """Clean up the test environment."""
-        if self.test_cache_dir.exists():
-            shutil.rmtree(self.test_cache_dir)
-        debug_dir = Path("debug")
-        if debug_dir.exists():
-            shutil.rmtree(debug_dir)
-
-    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request')
+    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request', new_callable=Mock)
     def test_summarize_entry_success(self, mock_make_ai_request):
         """Test successful summarization of an entry."""
         mock_response = {
@@ -70,7 +87,7 @@ class TestAIProcessor(unittest.TestCase):
             "impact": "High",
             "date": "2023-01-01"
         }
-        mock_make_ai_request.return_value = (json.dumps(mock_response), mock_response)
+        mock_make_ai_request.return_value = (orjson.dumps(mock_response).decode(), mock_response)
 
         result = self.ai_processor.summarize_entry(self.test_entry, self.test_feed_id, self.test_feed_title)
 
@@ -83,8 +100,9 @@ class TestAIProcessor(unittest.TestCase):
         self.assertIsNotNone(cached_summary)
         self.assertEqual(cached_summary['summary'], "This is a test summary.")
 
-    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request')
-    def test_summarize_entry_retry_and_fail(self, mock_make_ai_request):
+    @patch('rssky.core.ai_processor.time.sleep', return_value=None)
+    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request', new_callable=Mock)
+    def test_summarize_entry_retry_and_fail(self, mock_make_ai_request, mock_sleep):
         """Test that summarize_entry retries on failure and eventually returns a fallback."""
         # Simulate failure on all attempts
         mock_make_ai_request.return_value = (None, None)
@@ -100,7 +118,48 @@ class TestAIProcessor(unittest.TestCase):
         self.assertIsNotNone(cached_summary)
         self.assertIn("could not be extracted", cached_summary['summary'])
 
-    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request')
+    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request', new_callable=Mock)
+    def test_summarize_batch(self, mock_make_ai_request):
+        """Test batched summarization, including the per-entry fallback."""
+        entry2 = dict(self.test_entry, title='Second Entry',
+                      link='http://test.com/entry2', id='67890')
+        # Don't inherit the key get_entry_cache_key may have memoized on
+        # the copied fixture in an earlier test
+        entry2.pop('_cache_key', None)
+        entry2_id = self.cache_manager.create_entry_cache_key(entry2)
+        self.cache_manager.cache_content(self.test_feed_id, entry2_id, "Second article content.")
+
+        # The batch response indexes article 1 as a string (models answer
+        # "article": "1" as often as 1) and omits article 2, which must
+        # fall back to an individual summarize_entry call
+        batch_response = {"summaries": [
+            {"article": "1", "importance": 7, "summary": "Batch summary one.",
+             "impact": "Low", "date": "2023-01-01"},
+        ]}
+        single_response = {"importance": 6, "summary": "Individual summary two.",
+                           "impact": "Low", "date": "2023-01-01"}
+        mock_make_ai_request.side_effect = [
+            (orjson.dumps(batch_response).decode(), batch_response),
+            (orjson.dumps(single_response).decode(), single_response),
+        ]
+
+        results = self.ai_processor.summarize_batch([
+            (self.test_entry, self.test_feed_id, self.test_feed_title),
+            (entry2, self.test_feed_id, self.test_feed_title),
+        ])
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]['summary'], "Batch summary one.")
+        self.assertEqual(results[1]['summary'], "Individual summary two.")
+        # One call for the batch, one for the individual retry
+        self.assertEqual(mock_make_ai_request.call_count, 2)
+        # Both summaries were cached per entry
+        cached_one = self.cache_manager.get_entry_summary(self.test_feed_id, self.test_entry_id)
+        cached_two = self.cache_manager.get_entry_summary(self.test_feed_id, entry2_id)
+        self.assertEqual(cached_one['summary'], "Batch summary one.")
+        self.assertEqual(cached_two['summary'], "Individual summary two.")
+
+    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request', new_callable=Mock)
     def test_generate_digest_success(self, mock_make_ai_request):
         """Test successful generation of a daily digest."""
         # Setup: Create a cached summary for an entry
@@ -125,7 +184,7 @@ class TestAIProcessor(unittest.TestCase):
                 "sources": [{"name": self.test_feed_title, "title": "Test Entry", "url": "http://test.com/entry"}]
             }]
         }
-        mock_make_ai_request.return_value = (json.dumps(mock_digest_response), mock_digest_response)
+        mock_make_ai_request.return_value = (orjson.dumps(mock_digest_response).decode(), mock_digest_response)
 
         digest = self.ai_processor.generate_digest("20230101", [self.test_entry])
 
@@ -134,7 +193,7 @@ class TestAIProcessor(unittest.TestCase):
         self.assertEqual(digest['stories'][0]['title'], "Digested: Test Entry")
         mock_make_ai_request.assert_called_once()
 
-    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request')
+    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request', new_callable=Mock)
     def test_generate_digest_no_significant_entries(self, mock_make_ai_request):
         """Test digest generation when there are no entries with high enough importance."""
         # Setup: Create a cached summary with low importance
@@ -146,8 +205,9 @@ class TestAIProcessor(unittest.TestCase):
         self.assertEqual(digest, {"high_impact": [], "significant": []})
         mock_make_ai_request.assert_not_called()
 
-    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request')
-    def test_generate_digest_ai_failure(self, mock_make_ai_request):
+    @patch('rssky.core.ai_processor.time.sleep', return_value=None)
+    @patch('rssky.core.ai_processor.AIProcessor._make_ai_request', new_callable=Mock)
+    def test_generate_digest_ai_failure(self, mock_make_ai_request, mock_sleep):
         """Test that digest generation raises an error if the AI call fails repeatedly."""
         # Setup: Create a valid cached summary to trigger the digest process
         summary_data = {"importance": 8, "summary": "Important stuff."}
@@ -1,43 +1,55 @@
 import unittest
 import os
 import shutil
+import tempfile
 import time
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import hashlib 
-import json
 
 from rssky.core.cache_manager import CacheManager
 from rssky.utils.helpers import safe_filename 
 
 class TestCacheManager(unittest.TestCase):
-    def setUp(self):
-        """Set up a temporary cache directory for tests"""
-        self.test_cache_dir = Path("./test_cache")
-        self.test_cache_dir.mkdir(exist_ok=True)
-        self.cache_manager = CacheManager(cache_dir=str(self.test_cache_dir))
-        self.test_feed_url = "http://test.com/feed"
-        self.test_feed_title = "Example Feed"
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared, read-only fixtures once per class.
+
+        The directory, the CacheManager and the derived ids never change
+        between tests, so creating them per test was pure setup overhead.
+        """
+        # A RAM-backed directory under /dev/shm (when present) keeps the
+        # cache writes these tests hammer out of the disk entirely; the
+        # mkdtemp name is unique, so parallel xdist workers can't collide
+        shm = "/dev/shm"
+        cls._tmp = tempfile.TemporaryDirectory(
+            prefix="rssky_test_cache_", dir=shm if os.path.isdir(shm) else None)
+        cls.test_cache_dir = Path(cls._tmp.name)
+        cls.cache_manager = CacheManager(cache_dir=str(cls.test_cache_dir))
+        cls.test_feed_url = "http://test.com/feed"
+        cls.test_feed_title = "Example Feed"
         # Generate the feed_id expected by other tests
-        self.test_feed_id = self.cache_manager.generate_feed_id(self.test_feed_url, self.test_feed_title)
+        cls.test_feed_id = cls.cache_manager.generate_feed_id(cls.test_feed_url, cls.test_feed_title)
         # Define consistent entry data
-        self.test_entry_data = {'title': 'Test Entry 1', 'link': 'http://example.com/entry1', 'id': 'entry1'}
-        self.test_entry_id = CacheManager.create_entry_cache_key(self.test_entry_data)
-        # Corrected: Clean before each test using clear_all_cache
-        self.cache_manager.clear_all_cache()
+        cls.test_entry_data = {'title': 'Test Entry 1', 'link': 'http://example.com/entry1', 'id': 'entry1'}
+        cls.test_entry_id = CacheManager.create_entry_cache_key(cls.test_entry_data)
 
-    def tearDown(self):
-        """Remove the temporary cache directory after tests"""
-        if self.test_cache_dir.exists():
-            shutil.rmtree(self.test_cache_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary cache directory after the class is done"""
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Start each test from an empty cache"""
+        self.cache_manager.clear_all_cache()
 
     def test_feed_id_generation(self):
         """Test feed ID generation with various inputs."""
         feed_id_with_title = self.cache_manager.generate_feed_id(self.test_feed_url, self.test_feed_title)
-        # Calculate expected hash explicitly for clarity
-        expected_hash = hashlib.sha1(self.test_feed_url.encode()).hexdigest()[:8]
-        # Corrected Assertion: Use the hash value observed in the previous test run ('b714320b')
-        self.assertEqual(expected_hash, 'b714320b', "Calculated hash does not match expected 'b714320b'")
+        # Calculate expected hash explicitly for clarity (blake2b, 8 hex chars)
+        expected_hash = hashlib.blake2b(self.test_feed_url.encode('utf-8'), digest_size=4).hexdigest()
+        # Pin the hash value so an accidental algorithm change is caught
+        self.assertEqual(expected_hash, '4780d25b', "Calculated hash does not match expected '4780d25b'")
         # Construct the expected full ID using the observed hash
         expected_id = f"{safe_filename(self.test_feed_title)}_{expected_hash}"
         # Final comparison using the correctly calculated expected_id
@@ -47,6 +59,13 @@ class TestCacheManager(unittest.TestCase):
         self.assertEqual(len(feed_id_no_title), 40)
         self.assertNotIn("_", feed_id_no_title) # Should be just the hash
 
+        # Legacy mode keeps the SHA1 scheme so old cache trees resolve
+        legacy_manager = CacheManager(cache_dir=str(self.test_cache_dir), legacy_hash=True)
+        legacy_id = legacy_manager.generate_feed_id(self.test_feed_url, self.test_feed_title)
+        legacy_hash = hashlib.sha1(self.test_feed_url.encode()).hexdigest()[:8]
+        self.assertEqual(legacy_hash, 'b714320b')
+        self.assertEqual(legacy_id, f"{safe_filename(self.test_feed_title)}_{legacy_hash}")
+
         # Corrected: String literal properly terminated using single quotes.
         feed_id_special_chars = self.cache_manager.generate_feed_id("http://special.com/feed", 'Feed With/:*?"<>|Chars')
         # Corrected Assertion: Expect a single underscore after collapsing multiple replacements
@@ -66,8 +85,8 @@ class TestCacheManager(unittest.TestCase):
         feed_path = self.cache_manager.get_rawfeed_path(self.test_feed_id)
         # Check if the feed directory exists (implied by get_rawfeed_path creating it)
         self.assertTrue(feed_dir.exists())
-        # Check the raw feed file path specifically
-        self.assertTrue(str(feed_path).endswith(f"{self.test_feed_id}/rawfeed.json"))
+        # Check the raw feed file path specifically (compressed on disk)
+        self.assertTrue(str(feed_path).endswith(f"{self.test_feed_id}/rawfeed.json.gz"))
 
         # Use entry_id from setUp
         # Corrected Method Call: Use _get_entry_dir_path
@@ -112,6 +131,26 @@ class TestCacheManager(unittest.TestCase):
         self.assertFalse(summary_path.exists())
         self.assertIsNone(self.cache_manager.get_entry_summary(self.test_feed_id, self.test_entry_id))
 
+    def test_cache_feed_with_struct_time(self):
+        """Real feedparser entries carry time.struct_time in *_parsed."""
+        entry = {
+            'title': 'Parsed Entry',
+            'link': 'http://example.com/parsed',
+            'published': 'Sun, 01 Jan 2023 12:00:00 GMT',
+            'published_parsed': time.gmtime(1672574400),
+        }
+        feed_data = {'feed': {'title': self.test_feed_title}, 'entries': [entry]}
+
+        # Must not raise: orjson rejects tuple subclasses unless the
+        # encoder converts them (stdlib json accepted them implicitly)
+        self.cache_manager.cache_feed(self.test_feed_id, feed_data)
+
+        cached = self.cache_manager.get_cached_feed(self.test_feed_id)
+        self.assertIsNotNone(cached)
+        # struct_time round-trips as a plain list of its nine fields
+        self.assertEqual(cached['entries'][0]['published_parsed'],
+                         list(time.gmtime(1672574400)))
+
     def test_cache_validity(self):
         """Test cache validity checking (existence and age)."""
         # Use feed_id and entry_id from setUp
@@ -128,18 +167,11 @@ class TestCacheManager(unittest.TestCase):
         # Corrected Method Name: Use get_rawfeed_path to find the file to modify time
         feed_path = self.cache_manager.get_rawfeed_path(self.test_feed_id)
         old_time = time.time() - (2 * 3600) # 2 hours ago
-        # Corrected Check: Modify the internal timestamp in the JSON file
-        try:
-            with open(feed_path, 'r+', encoding='utf-8') as f:
-                data = json.load(f)
-                data['timestamp'] = old_time # Set internal timestamp to be old
-                f.seek(0)
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.truncate()
-        except (FileNotFoundError, json.JSONDecodeError, IOError) as e:
-            self.fail(f"Failed to modify timestamp in {feed_path}: {e}")
-        
-        # Corrected Check: Use get_cached_feed with short max_age, should return None due to old internal timestamp
+        # Age the cache file via its mtime, which the validity check reads;
+        # one utime syscall instead of a gzip+JSON rewrite round-trip
+        os.utime(feed_path, (old_time, old_time))
+
+        # Corrected Check: Use get_cached_feed with short max_age, should return None due to old mtime
         self.assertIsNone(self.cache_manager.get_cached_feed(self.test_feed_id, max_age_hours=1))
 
         # Cache summary - Corrected Call: Use feed_id, entry_id
@@ -176,27 +208,18 @@ class TestCacheManager(unittest.TestCase):
         old_time_dt = datetime.now(timezone.utc) - timedelta(days=2)
         old_time_ts = old_time_dt.timestamp()
 
-        # Corrected Method Name: Use get_rawfeed_path
+        # cache_feed/cache_content/cache_summary above guarantee these
+        # paths exist, so age them directly; one scandir pass over the
+        # entry directory replaces the per-file exists()+utime pairs
         feed_path_old = self.cache_manager.get_rawfeed_path(feed_id_old)
         entry_dir_old = self.cache_manager._get_entry_dir_path(feed_id_old, entry_id_old)
 
-        # Ensure parent directories exist
-        if feed_path_old.parent:
-            feed_path_old.parent.mkdir(parents=True, exist_ok=True)
-        entry_dir_old.mkdir(parents=True, exist_ok=True)
-
-        if feed_path_old.exists():
-            os.utime(feed_path_old, (old_time_ts, old_time_ts))
-
+        os.utime(feed_path_old, (old_time_ts, old_time_ts))
+        with os.scandir(entry_dir_old) as it:
+            for dir_entry in it:
+                os.utime(dir_entry.path, (old_time_ts, old_time_ts))
         os.utime(entry_dir_old, (old_time_ts, old_time_ts))
 
-        content_path_old = self.cache_manager.get_content_path(feed_id_old, entry_id_old)
-        summary_path_old = self.cache_manager.get_summary_path(feed_id_old, entry_id_old)
-        if content_path_old.exists():
-            os.utime(content_path_old, (old_time_ts, old_time_ts))
-        if summary_path_old.exists():
-            os.utime(summary_path_old, (old_time_ts, old_time_ts))
-
         # Corrected: Run cleanup using the correct public method name
         self.cache_manager.clean_old_cache(days_to_keep=1)
 
@@ -214,18 +237,28 @@ class TestCacheManager(unittest.TestCase):
         feed_id_nonexistent = "nonexistent_feed_id_abc123"
         entry_id_nonexistent = "nonexistent_entry_xyz456"
 
-        self.assertIsNone(self.cache_manager.get_cached_feed(feed_id_nonexistent))
-        self.assertIsNone(self.cache_manager.get_cached_content(feed_id_nonexistent, entry_id_nonexistent))
-        self.assertIsNone(self.cache_manager.get_entry_summary(feed_id_nonexistent, entry_id_nonexistent))
-        # Corrected Call: Use feed_id_nonexistent, entry_id_nonexistent
-        self.assertFalse(self.cache_manager.has_entry_summary(feed_id_nonexistent, entry_id_nonexistent))
-        # Corrected Check: Check validity by calling get_cached_feed, should be None
-        self.assertIsNone(self.cache_manager.get_cached_feed(feed_id_nonexistent, max_age_hours=1))
-
-        try:
-            self.cache_manager.clear_entry_summary(feed_id_nonexistent, entry_id_nonexistent)
-        except Exception as e:
-            self.fail(f"clear_entry_summary raised an exception unexpectedly: {e}")
+        # One table instead of six copy-pasted assertions; subTest keeps
+        # each case individually reported on failure
+        cases = [
+            ('get_cached_feed', (feed_id_nonexistent,), None),
+            ('get_cached_content', (feed_id_nonexistent, entry_id_nonexistent), None),
+            ('get_entry_summary', (feed_id_nonexistent, entry_id_nonexistent), None),
+            ('has_entry_summary', (feed_id_nonexistent, entry_id_nonexistent), False),
+            # Validity check with an age limit should also report a miss
+            ('get_cached_feed', (feed_id_nonexistent, 1), None),
+            # Clearing a missing summary must be a silent no-op; only the
+            # absence of an exception matters, not the return value
+            ('clear_entry_summary', (feed_id_nonexistent, entry_id_nonexistent), Ellipsis),
+        ]
+        for method, args, expected in cases:
+            with self.subTest(method=method, args=args):
+                result = getattr(self.cache_manager, method)(*args)
+                if expected is Ellipsis:
+                    continue
+                if expected is False:
+                    self.assertFalse(result)
+                else:
+                    self.assertIsNone(result)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file